@@ -1,56 +1,53 @@
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, TypedDict
-
-if TYPE_CHECKING:
-    from typing import NotRequired
+import msgspec
 
 __all__ = (
     "SonarrCalendarPayload",
     "SonarrSeriesPayload",
+    "SONARR_CALENDAR_DECODER",
+    "SONARR_SERIES_DECODER",
 )
 
 
-class _SonarrImages(TypedDict):
+class _SonarrImages(msgspec.Struct, frozen=True, gc=False):
     coverType: str
     url: str
 
 
-class _SonarrSeasons(TypedDict):
+class _SonarrSeasons(msgspec.Struct, frozen=True, gc=False):
     seasonNumber: int
     monitored: bool
 
 
-class _SonarrEpisodeFileQualityQualityPayload(TypedDict):
+class _SonarrEpisodeFileQualityQualityPayload(msgspec.Struct, frozen=True, gc=False):
     id: int
     name: str
     source: str
     resolution: int
 
 
-class _SonarrEpisodeFileQualityRevisionPayload(TypedDict):
+class _SonarrEpisodeFileQualityRevisionPayload(msgspec.Struct, frozen=True, gc=False):
     version: int
     real: int
     isRepack: bool
 
 
-class _SonarrEpisodeFileQualityPayload(TypedDict):
+class _SonarrEpisodeFileQualityPayload(msgspec.Struct, frozen=True, gc=False):
     quality: _SonarrEpisodeFileQualityQualityPayload
     revision: _SonarrEpisodeFileQualityRevisionPayload
 
 
-class _SonarrEpisodeFileLanguagePayload(TypedDict):
+class _SonarrEpisodeFileLanguagePayload(msgspec.Struct, frozen=True, gc=False):
     id: int
     name: str
 
 
-class _SonarrEpisodeFileMediaInfoPayload(TypedDict):
+class _SonarrEpisodeFileMediaInfoPayload(msgspec.Struct, frozen=True, gc=False):
     audioChannels: float
     audioCodec: str
     videoCodec: str
 
 
-class SonarrEpisodeFilePayload(TypedDict):
+class SonarrEpisodeFilePayload(msgspec.Struct, frozen=True, gc=False):
     seriesId: int
     seasonNumber: int
     relativePath: str
@@ -66,12 +63,12 @@ class SonarrEpisodeFilePayload(TypedDict):
     id: int
 
 
-class _SonarrSeriesRatings(TypedDict):
+class _SonarrSeriesRatings(msgspec.Struct, frozen=True, gc=False):
     votes: int
     value: float
 
 
-class SonarrSeriesPayload(TypedDict):
+class SonarrSeriesPayload(msgspec.Struct, frozen=True, gc=False):
     title: str
     sortTitle: str
     seasonCount: int
@@ -107,7 +104,7 @@ class SonarrSeriesPayload(TypedDict):
     id: int
 
 
-class SonarrCalendarPayload(TypedDict):
+class SonarrCalendarPayload(msgspec.Struct, frozen=True, gc=False, kw_only=True):
     seriesId: int
     episodeFileId: int
     seasonNumber: int
@@ -116,10 +113,15 @@ class SonarrCalendarPayload(TypedDict):
     airDate: str  # UTC Timezone
     airDateUtc: str  # UTC Timezone
     overview: str
-    episodeFile: NotRequired[SonarrEpisodeFilePayload]
+    episodeFile: SonarrEpisodeFilePayload | None = None
     hasFile: bool
     monitored: bool
     unverifiedSceneNumbering: bool
     series: SonarrSeriesPayload
     lastSearchTime: str
     id: int
+
+
+# decoder construction is not free, build these once and reuse them
+SONARR_CALENDAR_DECODER = msgspec.json.Decoder(list[SonarrCalendarPayload])
+SONARR_SERIES_DECODER = msgspec.json.Decoder(SonarrSeriesPayload)
@@ -9,9 +9,11 @@ This file was sourced from [RoboDanny](https://github.com/Rapptz/RoboDanny).
 from __future__ import annotations
 
 import asyncio
+import codecs
+import struct
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
 
-from .formats import from_json, to_json
+import msgspec
 
 if TYPE_CHECKING:
     import pathlib
@@ -23,9 +25,33 @@ else:
     _T = TypeVar("_T")
 _defT = TypeVar("_defT")
 
+_HEADER = struct.Struct(">I")
+_ENCODER = msgspec.msgpack.Encoder()
+_DECODER = msgspec.msgpack.Decoder()
+
+# journal operations, stored as ``[op, key, value]`` frames after the snapshot
+_OP_PUT = 0
+_OP_REMOVE = 1
+# the journal is never compacted below this many bytes, regardless of snapshot size
+_COMPACT_FLOOR = 64 * 1024
+
+_from_json = msgspec.json.decode
+
+
+def _frame(obj: Any) -> bytes:
+    buf = _ENCODER.encode(obj)
+    return _HEADER.pack(len(buf)) + buf
+
 
 class Config(Generic[_T]):
-    """The "database" object. Internally based on ``json``."""
+    """The "database" object. Internally based on length-prefixed ``msgpack``.
+
+    The file holds a snapshot of the whole config followed by a journal of individual edits,
+    so :meth:`put` and :meth:`remove` only append a small record. The file is rewritten as
+    a fresh snapshot once the journal grows past twice the size of the last one.
+
+    Files written in the older ``json`` format are migrated on first load.
+    """
 
     def __init__(
         self,
@@ -35,37 +61,122 @@ class Config(Generic[_T]):
         load_later: bool = False,
     ) -> None:
         self.path = path
-        self.loop = asyncio.get_event_loop()
         self.lock = asyncio.Lock()
         self._db: dict[str, _T] = {}
+        self._load_task: asyncio.Task[None] | None = None
+        # bytes currently on disk, and how many of those belong to the last snapshot
+        self._file_size: int = 0
+        self._snapshot_size: int = 0
 
         if load_later:
-            self.loop.create_task(self.load())
+            try:
+                self._load_task = asyncio.get_running_loop().create_task(self.load())
+            except RuntimeError:
+                # no running loop yet, so there is nothing to block by reading it right away
+                self.load_from_file()
         else:
             self.load_from_file()
 
     def load_from_file(self) -> None:
         try:
-            with self.path.open() as f:
-                self._db = from_json(f.read())
+            data = self.path.read_bytes()
         except FileNotFoundError:
             self._db = {}
+            self._file_size = self._snapshot_size = 0
+            return
+
+        # a frame header can't start with these bytes unless the snapshot is hundreds of megabytes
+        text = data.removeprefix(codecs.BOM_UTF8).lstrip()
+        if text[:1] in (b"{", b"["):
+            # legacy json file, rewrite it in the current format
+            self._db = _from_json(text, type=dict)
+            self._dump()
+            return
+
+        db: dict[str, _T] = {}
+        view = memoryview(data)
+        offset = 0
+        snapshot_size = 0
+        while offset + _HEADER.size <= len(data):
+            (size,) = _HEADER.unpack_from(data, offset)
+            end = offset + _HEADER.size + size
+            if end > len(data):
+                break
+
+            record = _DECODER.decode(view[offset + _HEADER.size : end])
+            if isinstance(record, dict):
+                db = record
+                snapshot_size = end - offset
+            elif record[0] == _OP_PUT:
+                db[record[1]] = record[2]
+            else:
+                db.pop(record[1], None)
+            offset = end
+
+        if offset == 0 and data:
+            # not even the first frame is intact, so this isn't a torn write of ours
+            # leave the file alone rather than replacing whatever it holds with an empty config
+            raise ValueError(f"{self.path} is not a readable config file")
+
+        self._db = db
+        self._file_size = offset
+        self._snapshot_size = snapshot_size
+        if offset != len(data) or self._needs_compaction():
+            # a torn trailing frame from an interrupted write, or an oversized journal
+            self._dump()
 
     async def load(self) -> None:
         async with self.lock:
-            await self.loop.run_in_executor(None, self.load_from_file)
+            await asyncio.get_running_loop().run_in_executor(None, self.load_from_file)
+
+    async def _ensure_loaded(self) -> None:
+        if self._load_task is not None:
+            await self._load_task
+            self._load_task = None
+
+    def _needs_compaction(self) -> bool:
+        return self._file_size > 2 * max(self._snapshot_size, _COMPACT_FLOOR)
 
     def _dump(self) -> None:
         temp = self.path.with_suffix(".tmp")
-        with temp.open("w", encoding="utf-8") as tmp:
-            tmp.write(to_json(self._db.copy()))
+        # no defensive copy: the encoder walks the dict in a single call without releasing the GIL,
+        # so mutations from the event loop can only land before or after it, never midway
+        frame = _frame(self._db)
+        with temp.open("wb") as tmp:
+            tmp.write(frame)
 
         # atomically move the file
         temp.replace(self.path)
+        self._file_size = self._snapshot_size = len(frame)
+
+    def _append(self, frame: bytes) -> None:
+        with self.path.open("ab") as fp:
+            fp.write(frame)
+
+        self._file_size += len(frame)
+        if self._needs_compaction():
+            self._dump()
+
+    async def _journal(self, frame: bytes) -> None:
+        async with self.lock:
+            await asyncio.get_running_loop().run_in_executor(None, self._append, frame)
 
     async def save(self) -> None:
+        """Writes a full snapshot of the current state to disk, discarding the journal.
+
+        The data is serialised in place rather than copied first, so stored values must not be
+        mutated from another thread while a save is in progress.
+        """
+        await self._ensure_loaded()
+        async with self.lock:
+            await asyncio.get_running_loop().run_in_executor(None, self._dump)
+
+    async def compact(self) -> None:
+        """Rewrites the file as a single snapshot if the journal has outgrown it."""
+        await self._ensure_loaded()
         async with self.lock:
-            await self.loop.run_in_executor(None, self._dump)
+            if self._needs_compaction():
+                await asyncio.get_running_loop().run_in_executor(None, self._dump)
 
     @overload
     def get(self, key: Any) -> _T | None: ...
@@ -79,18 +190,23 @@ class Config(Generic[_T]):
 
     async def put(self, key: Any, value: _T) -> None:
         """Edits a config entry."""
-        self._db[str(key)] = value
-        await self.save()
+        await self._ensure_loaded()
+        key = str(key)
+        frame = _frame([_OP_PUT, key, value])
+        self._db[key] = value
+        await self._journal(frame)
 
     __setitem__ = put
 
     async def remove(self, key: Any) -> None:
         """Removes a config entry."""
+        await self._ensure_loaded()
+        key = str(key)
         try:
-            del self._db[str(key)]
+            del self._db[key]
         except KeyError:
             return
-        await self.save()
+        await self._journal(_frame([_OP_REMOVE, key]))
 
     def __contains__(self, item: Any) -> bool:
         return str(item) in self._db
@@ -11,6 +11,7 @@ from __future__ import annotations
 import asyncio
 import enum
 import time
+from collections import deque
 from functools import wraps
 from typing import (
     TYPE_CHECKING,
@@ -46,22 +47,38 @@ class CacheProtocol(Protocol[R]):
 class ExpiringCache(dict, Generic[R]):
     def __init__(self, seconds: float) -> None:
         self.__ttl: float = seconds
+        # (inserted at, key) in insertion order; monotonic timestamps mean the oldest entry is always first
+        self.__expiry: deque[tuple[float, str]] = deque()
+        self.__last_sweep: float = time.monotonic()
         super().__init__()
 
-    def __verify_cache_integrity(self) -> None:
-        # Have to do this in two steps...
-        current_time = time.monotonic()
-        to_remove = [k for (k, (_, t)) in super().items() if current_time > (t + self.__ttl)]
-        for k in to_remove:
-            del self[k]
+    def __verify_cache_integrity(self, current_time: float) -> None:
+        self.__last_sweep = current_time
+        expiry = self.__expiry
+        while expiry and current_time > (expiry[0][0] + self.__ttl):
+            t, k = expiry.popleft()
+            # the key may have been overwritten or removed since, only drop it if this is still its entry
+            entry = super().get(k)
+            if entry is not None and entry[1] == t:
+                super().__delitem__(k)
 
     def __contains__(self, key: str) -> bool:
-        self.__verify_cache_integrity()
-        return super().__contains__(key)
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
 
     def __getitem__(self, key: str) -> R:
-        self.__verify_cache_integrity()
-        v, _ = super().__getitem__(key)
+        # reads only check their own key, the full sweep runs at most once per ttl
+        current_time = time.monotonic()
+        if current_time - self.__last_sweep > self.__ttl:
+            self.__verify_cache_integrity(current_time)
+
+        v, t = super().__getitem__(key)
+        if current_time > (t + self.__ttl):
+            super().__delitem__(key)
+            raise KeyError(key)
         return v
 
     def get(self, key: str, default: R | None = None) -> R | None:
@@ -71,7 +88,13 @@ class ExpiringCache(dict, Generic[R]):
         return v[0]
 
     def __setitem__(self, key: str, value: R) -> None:
-        super().__setitem__(key, (value, time.monotonic()))
+        now = time.monotonic()
+        # writes sweep too, otherwise overwrites keep queueing expiry entries while nothing reads
+        if now - self.__last_sweep > self.__ttl:
+            self.__verify_cache_integrity(now)
+
+        super().__setitem__(key, (value, now))
+        self.__expiry.append((now, key))
 
     def values(self) -> map[R]:
         return map(lambda x: x[0], super().values())  # noqa: C417
@@ -80,6 +103,24 @@ class ExpiringCache(dict, Generic[R]):
         return map(lambda x: (x[0], x[1][0]), super().items())  # noqa: C417
 
 
+# note: this only really works for this use case in particular
+# I want to pass asyncpg.Connection objects to the parameters
+# however, they use default __repr__ and I do not care what
+# connection is passed in, so I needed a bypass.
+_SKIPPED_KWARGS = frozenset(("connection", "pool"))
+
+
+# how far the invalidation index may outgrow the cache before it is rebuilt
+_INDEX_SLACK = 128
+
+
+def _true_repr(o: object) -> str:
+    # we do care what 'self' parameter is when we __repr__ it
+    if o.__class__.__repr__ is object.__repr__:
+        return f"<{o.__class__.__module__}.{o.__class__.__name__}>"
+    return repr(o)
+
+
 class Strategy(enum.Enum):
     lru = 1
     raw = 2
@@ -90,6 +131,8 @@ def cache(
     maxsize: int = 128,
     strategy: Strategy = Strategy.lru,
     ignore_kwargs: bool = False,
+    *,
+    ttl: float | None = None,
 ) -> Callable[[Callable[..., Coroutine[Any, Any, R]]], CacheProtocol[R]]:
     def decorator(func: Callable[..., Coroutine[Any, Any, R]]) -> CacheProtocol[R]:
         if strategy is Strategy.lru:
@@ -99,26 +142,18 @@ def cache(
             _internal_cache = {}
             _stats = lambda: (0, 0)
         elif strategy is Strategy.timed:
-            _internal_cache = ExpiringCache(maxsize)
+            # maxsize doubled as the expiry in seconds before ttl existed
+            _internal_cache = ExpiringCache(maxsize if ttl is None else ttl)
             _stats = lambda: (0, 0)
 
+        prefix = f"{func.__module__}.{func.__name__}"
+
         def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
-            # this is a bit of a cluster fuck
-            # we do care what 'self' parameter is when we __repr__ it
-            def _true_repr(o: object) -> str:
-                if o.__class__.__repr__ is object.__repr__:
-                    return f"<{o.__class__.__module__}.{o.__class__.__name__}>"
-                return repr(o)
-
-            key = [f"{func.__module__}.{func.__name__}"]
-            key.extend(_true_repr(o) for o in args)
+            key = [prefix]
+            key.extend(map(_true_repr, args))
             if not ignore_kwargs:
                 for k, v in kwargs.items():
-                    # note: this only really works for this use case in particular
-                    # I want to pass asyncpg.Connection objects to the parameters
-                    # however, they use default __repr__ and I do not care what
-                    # connection is passed in, so I needed a bypass.
-                    if k == "connection" or k == "pool":
+                    if k in _SKIPPED_KWARGS:
                         continue
 
                     key.append(_true_repr(k))
@@ -126,6 +161,39 @@ def cache(
 
             return ":".join(key)
 
+        # ":"-separated key segment -> keys containing it, for invalidate_containing
+        # evictions by the underlying cache are not reported, so stale keys are pruned lazily
+        _index: dict[str, set[str]] = {}
+        _indexed: set[str] = set()
+
+        def _index_add(key: str) -> None:
+            if key in _indexed:
+                return
+
+            if len(_indexed) > 2 * len(_internal_cache) + _INDEX_SLACK:
+                _index_rebuild()
+
+            _indexed.add(key)
+            for token in key.split(":"):
+                _index.setdefault(token, set()).add(key)
+
+        def _index_discard(key: str) -> None:
+            _indexed.discard(key)
+            for token in key.split(":"):
+                keys = _index.get(token)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del _index[token]
+
+        def _index_rebuild() -> None:
+            _index.clear()
+            _indexed.clear()
+            for key in _internal_cache.keys():  # noqa: SIM118, LRU ain't iterable
+                _indexed.add(key)
+                for token in key.split(":"):
+                    _index.setdefault(token, set()).add(key)
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             key = _make_key(args, kwargs)
@@ -133,6 +201,7 @@ def cache(
                 task = _internal_cache[key]
             except KeyError:
                 _internal_cache[key] = task = asyncio.create_task(func(*args, **kwargs))
+                _index_add(key)
                 return task
             else:
                 return task
@@ -146,8 +215,15 @@ def cache(
                 return True
 
         def _invalidate_containing(key: str) -> None:
-            to_remove = [k for k in _internal_cache.keys() if key in k]  # noqa: SIM118, LRU ain't iterable
+            if ":" in key:
+                # may span segments, fall back to checking every key
+                to_remove = [k for k in _internal_cache.keys() if key in k]  # noqa: SIM118, LRU ain't iterable
+            else:
+                # a substring without the separator can only match within a single segment
+                to_remove = {k for token, keys in _index.items() if key in token for k in keys}
+
             for k in to_remove:
+                _index_discard(k)
                 try:
                     del _internal_cache[k]
                 except KeyError:
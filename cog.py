@@ -3,9 +3,9 @@ import logging
 from collections.abc import Callable
 from typing import (
     Any,
+    ClassVar,
     Generic,
     Literal,
-    NamedTuple,
     TypeVar,
 )
 
@@ -25,12 +25,6 @@ FuncT = TypeVar("FuncT", bound="Callable[..., Any]")
 BotT = TypeVar("BotT", bound="commands.Bot")
 
 
-class Route(NamedTuple):
-    name: str
-    method: str
-    func: Callable[..., Any]
-
-
 def route(method: Literal["get", "post", "put", "patch", "delete"], request_path: str) -> Callable[[FuncT], FuncT]:
     def decorator(func: FuncT) -> FuncT:
         actual = func
@@ -47,25 +41,40 @@ def route(method: Literal["get", "post", "put", "patch", "delete"], request_path
 
 
 class _BaseWebserver:
+    # (attribute name, method, path), collected once per class
+    __routes__: ClassVar[tuple[tuple[str, str, str], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # walk the MRO base-first over the raw class namespaces, so properties are never invoked
+        # and an override in a subclass replaces (or removes) the parent's route of the same name
+        routes: dict[str, tuple[str, str, str]] = {}
+        for klass in reversed(cls.__mro__[:-1]):
+            for attr_name, attr in vars(klass).items():
+                if isinstance(attr, staticmethod):
+                    attr = attr.__func__
+                if callable(attr) and (path := getattr(attr, "__ipc_route_path__", None)) is not None:
+                    routes[attr_name] = (attr_name, attr.__ipc_method__, path)
+                else:
+                    routes.pop(attr_name, None)
+
+        cls.__routes__ = tuple(routes.values())
+
     @property
     def logger(self) -> logging.Logger:
         return logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
     def __init__(self) -> None:
-        self.routes: list[Route] = []
+        self.routes: tuple[web.RouteDef, ...] = tuple(
+            web.route(method, path, getattr(self, attr_name)) for attr_name, method, path in self.__routes__
+        )
 
         self.app: web.Application = web.Application()
         self._runner = web.AppRunner(self.app)
         self._webserver: web.TCPSite | None = None
 
-        for attr in (getattr(self, x, None) for x in dir(self)):
-            if attr is None:
-                continue
-            if (name := getattr(attr, "__ipc_route_path__", None)) is not None:
-                route: str = attr.__ipc_method__
-                self.routes.append(Route(func=attr, name=name, method=route))
-
-        self.app.add_routes([web.route(x.method, x.name, x.func) for x in self.routes])
+        self.app.add_routes(self.routes)
 
     async def start(self, *, host: str = "localhost", port: int) -> None:
         self.logger.debug("Starting %s runner.", self.__class__.__name__)
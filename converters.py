@@ -9,24 +9,34 @@ This file was sourced from [RoboDanny](https://github.com/Rapptz/RoboDanny).
 from __future__ import annotations
 
 import datetime
+import functools
 import logging
 import re
 import zoneinfo
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
+import msgspec
 import yarl
 from discord import Member, User, Webhook, app_commands
 from discord.ext import commands
 
+from .cache import ExpiringCache
+from .formats import from_json
 from .time import hf_time
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from typing import NotRequired, Self
 
+    import asyncpg
+
     from ..context import Context, GuildContext, Interaction
 
-MYSTBIN_REGEX = re.compile(r"(?:(?:https?://)?(?:beta\.)?(?:mystb\.in\/))?(?P<id>(?:[A-Z]{1}[a-z]+)*)(?P<ext>\.\w+)?")
+MYSTBIN_REGEX = re.compile(r"(?:(?:https?://)?(?:beta\.)?mystb\.in/)?(?P<id>(?:[A-Z][a-z]+)+)(?:\.\w+)?")
+# common filler around WhenAndWhat input, e.g. "me to ... from now"
+_WAW_PREFIX = re.compile(r"\Ame (?:to|in|at|that) ")
+_WAW_SUFFIX = re.compile(r"from now\Z")
+_DUCKLING_DIMS = '["time", "duration"]'
 LOGGER = logging.getLogger(__name__)
 
 __all__ = (
@@ -38,8 +48,45 @@ __all__ = (
     "WebhookTransformer",
     "BadDatetimeTransform",
     "MystbinPasteConverter",
+    "invalidate_timezone",
 )
 
+# user_id -> tz_store name, saves a query per converter call and per autocomplete keystroke
+_TZ_CACHE: ExpiringCache[str] = ExpiringCache(300)
+
+
+@functools.lru_cache(maxsize=512)
+def _zi(name: str) -> zoneinfo.ZoneInfo:
+    return zoneinfo.ZoneInfo(name)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_duckling_url(host: str, port: int) -> yarl.URL:
+    return yarl.URL.build(scheme="http", host=host, port=port, path="/parse")
+
+
+def _duckling_url(client: Any) -> yarl.URL:
+    duckling_key = client.config.get("duckling")
+    if not duckling_key:
+        raise RuntimeError("No Duckling instance available to perform this action.")
+
+    return _build_duckling_url(duckling_key["host"], duckling_key["port"])
+
+
+async def _fetch_timezone(pool: asyncpg.Pool[asyncpg.Record], user_id: int) -> zoneinfo.ZoneInfo:
+    try:
+        name = _TZ_CACHE[user_id]  # type: ignore # keyed by int
+    except KeyError:
+        row: str | None = await pool.fetchval("SELECT tz FROM tz_store WHERE user_id = $1;", user_id)
+        _TZ_CACHE[user_id] = name = row or "UTC"  # type: ignore # keyed by int
+
+    return _zi(name)
+
+
+def invalidate_timezone(user_id: int, /) -> None:
+    """Drops the cached timezone for a user, call this after changing their ``tz_store`` row."""
+    _TZ_CACHE.pop(user_id, None)
+
 
 class DucklingNormalised(TypedDict):
     unit: Literal["second"]
@@ -68,16 +115,116 @@ class DucklingResponse(TypedDict):
     value: DucklingResponseValue
 
 
+# only the fields needed to find a submission's video, everything else is skipped while decoding
+class _RedditVideo(msgspec.Struct):
+    fallback_url: str
+
+
+class _RedditMedia(msgspec.Struct):
+    reddit_video: _RedditVideo | None = None
+
+
+class _RedditSubmission(msgspec.Struct):
+    media: _RedditMedia | None = None
+    crosspost_parent_list: list[_RedditSubmission] = []
+
+
+class _RedditChild(msgspec.Struct):
+    data: _RedditSubmission
+
+
+class _RedditListingData(msgspec.Struct):
+    children: list[_RedditChild]
+
+
+class _RedditListing(msgspec.Struct):
+    data: _RedditListingData
+
+
+_REDDIT_DECODER = msgspec.json.Decoder(list[_RedditListing])
+
+
 class MemeDict(dict):
+    __slots__ = ("_index",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # alias -> first key containing it, rebuilt on the next lookup after any change
+        self._index: dict[Any, Sequence[Any]] | None = None
+
+    def _build_index(self) -> dict[Any, Sequence[Any]]:
+        index: dict[Any, Sequence[Any]] = {}
+        for key in self:
+            # string keys match by substring and anything else can't be enumerated, either one could match
+            # any alias so nothing after it may be answered from the index without changing the scan order
+            if isinstance(key, str):
+                break
+
+            try:
+                for member in key:
+                    index.setdefault(member, key)
+            except TypeError:
+                break
+
+        self._index = index
+        return index
+
     def __getitem__(self, k: Sequence[Any]) -> Any:
+        index = self._index
+        if index is None:
+            index = self._build_index()
+
+        try:
+            return super().__getitem__(index[k])
+        except (KeyError, TypeError):
+            pass
+
         for key in self:
             if k in key:
                 return super().__getitem__(key)
         raise KeyError(k)
 
+    def __setitem__(self, key: Sequence[Any], value: Any) -> None:
+        super().__setitem__(key, value)
+        self._index = None
+
+    def __delitem__(self, key: Sequence[Any]) -> None:
+        super().__delitem__(key)
+        self._index = None
+
+    def __ior__(self, other: Any) -> Self:
+        super().__ior__(other)
+        self._index = None
+        return self
+
+    def pop(self, *args: Any) -> Any:
+        self._index = None
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[Any, Any]:
+        self._index = None
+        return super().popitem()
+
+    def setdefault(self, key: Sequence[Any], default: Any = None) -> Any:
+        self._index = None
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._index = None
+
+    def clear(self) -> None:
+        super().clear()
+        self._index = None
+
 
 class RedditMediaURL:
-    VALID_PATH = re.compile(r"/r/[A-Za-z0-9_]+/comments/[A-Za-z0-9]+(?:/.+)?")
+    __slots__ = (
+        "url",
+        "filename",
+    )
+
+    VALID_PATH = re.compile(r"/r/[A-Za-z0-9_]+/comments/[A-Za-z0-9]+(?:/.*)?")
 
     def __init__(self, url: yarl.URL) -> None:
         self.url = url
@@ -100,7 +247,7 @@ class RedditMediaURL:
         if url.host is None:
             raise commands.BadArgument("Not a valid v.reddit url.")
 
-        is_valid_path = url.host.endswith(".reddit.com") and cls.VALID_PATH.match(url.path)
+        is_valid_path = url.host.endswith(".reddit.com") and cls.VALID_PATH.fullmatch(url.path)
         if not is_valid_path:
             raise commands.BadArgument("Not a reddit URL.")
 
@@ -109,35 +256,62 @@ class RedditMediaURL:
             if resp.status != 200:
                 raise commands.BadArgument(f"Reddit API failed with {resp.status}.")
 
-            data = await resp.json()
-            try:
-                submission = data[0]["data"]["children"][0]["data"]
-            except (KeyError, TypeError, IndexError):
-                raise commands.BadArgument("Could not fetch submission.")
+            raw = await resp.read()
 
-            try:
-                media = submission["media"]["reddit_video"]
-            except (KeyError, TypeError):
-                try:
-                    # maybe it's a cross post
-                    crosspost = submission["crosspost_parent_list"][0]
-                    media = crosspost["media"]["reddit_video"]
-                except (KeyError, TypeError, IndexError):
-                    raise commands.BadArgument("Could not fetch media information.")
+        try:
+            listings = _REDDIT_DECODER.decode(raw)
+        except msgspec.DecodeError:
+            # an unexpected shape, walk it by hand so the error says what was missing
+            return cls(cls._walk_fallback_url(from_json(raw)))
 
+        try:
+            submission = listings[0].data.children[0].data
+        except IndexError:
+            raise commands.BadArgument("Could not fetch submission.")
+
+        media = submission.media and submission.media.reddit_video
+        if media is None:
+            # maybe it's a cross post
+            crosspost = submission.crosspost_parent_list[0] if submission.crosspost_parent_list else None
+            media = crosspost and crosspost.media and crosspost.media.reddit_video
+            if media is None:
+                raise commands.BadArgument("Could not fetch media information.")
+
+        return cls(yarl.URL(media.fallback_url))
+
+    @staticmethod
+    def _walk_fallback_url(data: Any) -> yarl.URL:
+        try:
+            submission = data[0]["data"]["children"][0]["data"]
+        except (KeyError, TypeError, IndexError):
+            raise commands.BadArgument("Could not fetch submission.")
+
+        try:
+            media = submission["media"]["reddit_video"]
+        except (KeyError, TypeError):
             try:
-                fallback_url = yarl.URL(media["fallback_url"])
-            except KeyError:
-                raise commands.BadArgument("Could not fetch fall back URL.")
+                # maybe it's a cross post
+                crosspost = submission["crosspost_parent_list"][0]
+                media = crosspost["media"]["reddit_video"]
+            except (KeyError, TypeError, IndexError):
+                raise commands.BadArgument("Could not fetch media information.")
 
-            return cls(fallback_url)
+        try:
+            fallback_url = yarl.URL(media["fallback_url"])
+        except KeyError:
+            raise commands.BadArgument("Could not fetch fall back URL.")
+
+        return fallback_url
 
 
 class DatetimeConverter(commands.Converter[datetime.datetime]):
     @staticmethod
     async def get_timezone(ctx: Context) -> zoneinfo.ZoneInfo | None:
-        row: str | None = await ctx.bot.pool.fetchval("SELECT tz FROM tz_store WHERE user_id = $1;", ctx.author.id)
-        tz = zoneinfo.ZoneInfo(row) if row else zoneinfo.ZoneInfo("UTC")
+        # several converters may run against the same invocation, only resolve it once
+        tz: zoneinfo.ZoneInfo | None = getattr(ctx, "_cached_tz", None)
+        if tz is None:
+            tz = await _fetch_timezone(ctx.bot.pool, ctx.author.id)
+            ctx._cached_tz = tz  # type: ignore # ad-hoc attribute
 
         return tz
 
@@ -161,11 +335,13 @@ class DatetimeConverter(commands.Converter[datetime.datetime]):
             data={
                 "locale": "en_US",
                 "text": argument,
-                "dims": '["time", "duration"]',
+                "dims": _DUCKLING_DIMS,
                 "tz": str(timezone),
             },
         ) as response:
-            data: list[DucklingResponse] = await response.json()
+            data: list[DucklingResponse] = from_json(await response.read())
+            # durations are relative to when the response arrived, one clock read covers all of them
+            current = datetime.datetime.now(datetime.UTC)
 
             for time in data:
                 if time["dim"] == "time" and "value" in time["value"]:
@@ -179,8 +355,7 @@ class DatetimeConverter(commands.Converter[datetime.datetime]):
                 elif time["dim"] == "duration":
                     times.append(
                         (
-                            datetime.datetime.now(datetime.UTC)
-                            + datetime.timedelta(seconds=time["value"]["normalized"]["value"]),
+                            current + datetime.timedelta(seconds=time["value"]["normalized"]["value"]),
                             time["start"],
                             time["end"],
                         ),
@@ -193,16 +368,7 @@ class DatetimeConverter(commands.Converter[datetime.datetime]):
         timezone = await cls.get_timezone(ctx)
         now = ctx.message.created_at.astimezone(tz=timezone)
 
-        duckling_key = ctx.bot.config.get("duckling")
-        if not duckling_key:
-            raise RuntimeError("No Duckling instance available to perform this action.")
-
-        duckling_url = yarl.URL.build(
-            scheme="http",
-            host=duckling_key["host"],
-            port=duckling_key["port"],
-            path="/parse",
-        )
+        duckling_url = _duckling_url(ctx.bot)
 
         parsed_times = await cls.parse(argument, ctx=ctx, timezone=timezone, now=now, duckling_url=duckling_url)
 
@@ -221,27 +387,10 @@ class WhenAndWhatConverter(commands.Converter[tuple[datetime.datetime, str]]):
         now = ctx.message.created_at.astimezone(tz=timezone)
 
         # Strip some common stuff
-        for prefix in ("me to ", "me in ", "me at ", "me that "):
-            if argument.startswith(prefix):
-                argument = argument[len(prefix) :]
-                break
-
-        for suffix in ("from now",):
-            if argument.endswith(suffix):
-                argument = argument[: -len(suffix)]
+        argument = _WAW_PREFIX.sub("", argument, count=1)
+        argument = _WAW_SUFFIX.sub("", argument, count=1).strip()
 
-        argument = argument.strip()
-
-        duckling_key = ctx.bot.config.get("duckling")
-        if not duckling_key:
-            raise RuntimeError("No Duckling instance available to perform this action.")
-
-        duckling_url = yarl.URL.build(
-            scheme="http",
-            host=duckling_key["host"],
-            port=duckling_key["port"],
-            path="/parse",
-        )
+        duckling_url = _duckling_url(ctx.bot)
 
         # Determine the date argument
         parsed_times = await DatetimeConverter.parse(
@@ -267,9 +416,7 @@ class WhenAndWhatConverter(commands.Converter[tuple[datetime.datetime, str]]):
 
         what = argument[end + 1 :].lstrip(" ,.!:;") if begin == 0 else argument[:begin].strip()
 
-        for prefix in ("to ",):
-            if what.startswith(prefix):
-                what = what[len(prefix) :]
+        what = what.removeprefix("to ")
 
         return (when, what or "…")
 
@@ -281,13 +428,7 @@ class BadDatetimeTransform(app_commands.AppCommandError):
 class DatetimeTransformer(app_commands.Transformer):
     @staticmethod
     async def get_timezone(interaction: Interaction) -> zoneinfo.ZoneInfo | None:
-        row: str | None = await interaction.client.pool.fetchval(
-            "SELECT tz FROM tz_store WHERE user_id = $1;",
-            interaction.user.id,
-        )
-        tz = zoneinfo.ZoneInfo(row) if row else zoneinfo.ZoneInfo("UTC")
-
-        return tz
+        return await _fetch_timezone(interaction.client.pool, interaction.user.id)
 
     @classmethod
     async def parse(
@@ -309,11 +450,12 @@ class DatetimeTransformer(app_commands.Transformer):
             data={
                 "locale": "en_US",
                 "text": argument,
-                "dims": '["time", "duration"]',
+                "dims": _DUCKLING_DIMS,
                 "tz": str(timezone),
             },
         ) as response:
-            data: list[DucklingResponse] = await response.json()
+            data: list[DucklingResponse] = from_json(await response.read())
+            current = datetime.datetime.now(timezone)
 
             for time in data:
                 if time["dim"] == "time" and "value" in time["value"]:
@@ -327,8 +469,7 @@ class DatetimeTransformer(app_commands.Transformer):
                 elif time["dim"] == "duration":
                     times.append(
                         (
-                            datetime.datetime.now(timezone)
-                            + datetime.timedelta(seconds=time["value"]["normalized"]["value"]),
+                            current + datetime.timedelta(seconds=time["value"]["normalized"]["value"]),
                             time["start"],
                             time["end"],
                         ),
@@ -341,16 +482,7 @@ class DatetimeTransformer(app_commands.Transformer):
         timezone = await cls.get_timezone(interaction)
         now = interaction.created_at.astimezone(tz=timezone)
 
-        duckling_key = interaction.client.config.get("duckling")
-        if not duckling_key:
-            raise RuntimeError("No Duckling instance available to perform this action.")
-
-        duckling_url = yarl.URL.build(
-            scheme="http",
-            host=duckling_key["host"],
-            port=duckling_key["port"],
-            path="/parse",
-        )
+        duckling_url = _duckling_url(interaction.client)
 
         parsed_times = await cls.parse(
             argument,
@@ -371,23 +503,9 @@ class DatetimeTransformer(app_commands.Transformer):
         if not value:
             return []
 
-        duckling_key = interaction.client.config.get("duckling")
-        if not duckling_key:
-            raise RuntimeError("No Duckling instance available to perform this action.")
-
-        duckling_url = yarl.URL.build(
-            scheme="http",
-            host=duckling_key["host"],
-            port=duckling_key["port"],
-            path="/parse",
-        )
+        duckling_url = _duckling_url(interaction.client)
 
-        # implement caching
-        # if interaction.user.id in cache:
-        #   tz = cache[interaction.user.id]
-        # else:
         tz = await self.get_timezone(interaction)
-        #   cache[interaction.user.id] = tz
 
         now = interaction.created_at.astimezone(tz=tz)
         parsed_times = await self.parse(
@@ -410,27 +528,10 @@ class WhenAndWhatTransformer(DatetimeTransformer):
         now = interaction.created_at.astimezone(tz=timezone)
 
         # Strip some common stuff
-        for prefix in ("me to ", "me in ", "me at ", "me that "):
-            if value.startswith(prefix):
-                value = value[len(prefix) :]
-                break
-
-        for suffix in ("from now",):
-            if value.endswith(suffix):
-                value = value[: -len(suffix)]
-
-        value = value.strip()
+        value = _WAW_PREFIX.sub("", value, count=1)
+        value = _WAW_SUFFIX.sub("", value, count=1).strip()
 
-        duckling_key = interaction.client.config.get("duckling")
-        if not duckling_key:
-            raise RuntimeError("No Duckling instance available to perform this action.")
-
-        duckling_url = yarl.URL.build(
-            scheme="http",
-            host=duckling_key["host"],
-            port=duckling_key["port"],
-            path="/parse",
-        )
+        duckling_url = _duckling_url(interaction.client)
 
         parsed_times = await cls.parse(
             value,
@@ -455,9 +556,7 @@ class WhenAndWhatTransformer(DatetimeTransformer):
 
         what = value[end + 1 :].lstrip(" ,.!:;") if begin == 0 else value[:begin].strip()
 
-        for prefix in ("to ",):
-            if what.startswith(prefix):
-                what = what[len(prefix) :]
+        what = what.removeprefix("to ")
 
         return when
 
@@ -481,7 +580,7 @@ class Snowflake:
 
 class MystbinPasteConverter(commands.Converter[str]):
     async def convert(self, ctx: GuildContext, argument: str) -> str:
-        matches = MYSTBIN_REGEX.search(argument)
+        matches = MYSTBIN_REGEX.fullmatch(argument)
         if not matches:
             raise commands.ConversionError(self, ValueError("No Mystbin IDs found in this text."))
 
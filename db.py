@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from .formats import from_json, to_json
+import msgspec
 
 if TYPE_CHECKING:
     import asyncpg
@@ -44,13 +44,25 @@ class MaybeAcquire:
             await self.pool.release(self._connection)  # type: ignore # navigating stubs
 
 
-def _encode_jsonb(value: Any) -> str:
-    return to_json(value)
+# the binary jsonb wire format is a version byte followed by the json text
+_JSONB_VERSION = b"\x01"
+_JSON_ENCODER = msgspec.json.Encoder()
+_JSON_DECODER = msgspec.json.Decoder()
 
 
-def _decode_jsonb(value: str) -> Any:
-    return from_json(value)
+def _encode_jsonb(value: Any) -> bytes:
+    return _JSONB_VERSION + _JSON_ENCODER.encode(value)
+
+
+def _decode_jsonb(value: bytes) -> Any:
+    return _JSON_DECODER.decode(memoryview(value)[1:])
 
 
 async def db_init(connection: asyncpg.Connection) -> None:
-    await connection.set_type_codec("jsonb", schema="pg_catalog", encoder=_encode_jsonb, decoder=_decode_jsonb)
+    await connection.set_type_codec(
+        "jsonb",
+        schema="pg_catalog",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        format="binary",
+    )
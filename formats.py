@@ -217,9 +217,9 @@ try:
 except ImportError:
 
     def to_json(obj: Any) -> str:
-        return json.dumps(obj, separators=(",", "."), ensure_ascii=True, indent=2, sort_keys=True)
+        return json.dumps(obj, separators=(",", ": "), ensure_ascii=True, indent=2, sort_keys=True)
 
-    def from_json(obj: str) -> Any:
+    def from_json(obj: str | bytes) -> Any:
         return json.loads(obj)
 
 else:
@@ -227,7 +227,7 @@ else:
     def to_json(obj: Any) -> str:
         return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
 
-    def from_json(obj: str) -> Any:  # pyright: ignore[reportRedeclaration] # this is fine
+    def from_json(obj: str | bytes) -> Any:  # pyright: ignore[reportRedeclaration] # this is fine
         return orjson.loads(obj)
 
 
@@ -2,6 +2,7 @@
 
 import functools
 import inspect
+import itertools
 import logging
 import types
 from collections import OrderedDict
@@ -18,6 +19,9 @@ ArgValGetter = Callable[[BoundArgs], Any]
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# a function's signature never changes, bounded as bound methods hash per instance
+_signature = functools.lru_cache(maxsize=1024)(inspect.signature)
+
 
 class GlobalNameConflictError(Exception):
     """Raised when there's a conflict between the globals used to resolve annotations of wrapped and its wrapper."""
@@ -33,14 +37,15 @@ def get_arg_value(name_or_pos: Argument, arguments: BoundArgs) -> Any:
     Raise ValueError if `name_or_pos` does not match any argument.
     """
     if isinstance(name_or_pos, int):
-        # Convert arguments to a tuple to make them indexable.
-        arg_values = tuple(arguments.items())
         arg_pos = name_or_pos
 
         try:
-            _, value = arg_values[arg_pos]
-            return value
-        except IndexError:
+            if arg_pos < 0:
+                # Counting from the end needs every value to be indexable.
+                return tuple(arguments.values())[arg_pos]
+            # Otherwise step to the position without materialising the arguments.
+            return next(itertools.islice(arguments.values(), arg_pos, None))
+        except (IndexError, StopIteration):
             raise ValueError(f"Argument position {arg_pos} is out of bounds.")
     elif isinstance(name_or_pos, str):
         arg_name = name_or_pos
@@ -83,7 +88,7 @@ def get_bound_args(func: Callable, args: tuple, kwargs: dict[str, Any]) -> Bound
 
     Default parameter values are also set.
     """
-    sig = inspect.signature(func)
+    sig = _signature(func)
     bound_args = sig.bind(*args, **kwargs)
     bound_args.apply_defaults()
 
@@ -110,12 +115,22 @@ def update_wrapper_globals(
     `wrapped`'s typehints and is not in `ignored_conflict_names`,
     as this can cause incorrect objects being used by discordpy's converters.
     """
-    annotation_global_names = (
+    wrapper_names = frozenset(wrapper.__code__.co_names)
+    wrapped_globals = wrapped.__globals__
+    wrapper_globals = wrapper.__globals__
+    annotation_global_names = {
         ann.split(".", maxsplit=1)[0] for ann in wrapped.__annotations__.values() if isinstance(ann, str)
-    )
+    }
     # Conflicting globals from both functions' modules that are also used in the wrapper and in wrapped's annotations.
-    shared_globals = set(wrapper.__code__.co_names) & set(annotation_global_names)
-    shared_globals &= set(wrapped.__globals__) & set(wrapper.__globals__) - ignored_conflict_names
+    # Only the handful of annotation names are checked, rather than building sets of both modules' globals.
+    shared_globals = [
+        name
+        for name in annotation_global_names
+        if name in wrapper_names
+        and name in wrapped_globals
+        and name in wrapper_globals
+        and name not in ignored_conflict_names
+    ]
     if shared_globals:
         raise GlobalNameConflictError(
             f"wrapper and the wrapped function share the following "
@@ -123,8 +138,8 @@ def update_wrapper_globals(
             f"the name to the `ignored_conflict_names` set to suppress this error if this is intentional."
         )
 
-    new_globals = wrapper.__globals__.copy()
-    new_globals.update((k, v) for k, v in wrapped.__globals__.items() if k not in wrapper.__code__.co_names)
+    new_globals = wrapper_globals.copy()
+    new_globals.update((k, v) for k, v in wrapped_globals.items() if k not in wrapper_names)
     return types.FunctionType(
         code=wrapper.__code__,
         globals=new_globals,
@@ -10,7 +10,9 @@ This file was sourced from [RoboDanny](https://github.com/Rapptz/RoboDanny).
 
 from __future__ import annotations
 
+import functools
 import heapq
+import operator
 import re
 from difflib import SequenceMatcher
 from typing import TYPE_CHECKING, Literal, TypeVar, overload
@@ -21,60 +23,168 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
-def ratio(a: str, b: str) -> int:
+# scorers return 0 once they can tell the score would fall below score_cutoff
+def quick_ratio(a: str, b: str, *, score_cutoff: int = 0) -> int:
     m = SequenceMatcher(None, a, b)
-    return int(round(100 * m.ratio()))
+    if score_cutoff and int(round(100 * m.real_quick_ratio())) < score_cutoff:
+        return 0
+    return int(round(100 * m.quick_ratio()))
 
 
-def quick_ratio(a: str, b: str) -> int:
-    m = SequenceMatcher(None, a, b)
-    return int(round(100 * m.quick_ratio()))
+try:
+    from rapidfuzz import fuzz as _rf, process as _rf_process  # pyright: ignore[reportMissingImports]  # may not always exist
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+    def ratio(a: str, b: str, *, score_cutoff: int = 0) -> int:
+        m = SequenceMatcher(None, a, b)
+        # both bounds are cheap upper limits of ratio(), try them before the full comparison
+        if score_cutoff and (
+            int(round(100 * m.real_quick_ratio())) < score_cutoff or int(round(100 * m.quick_ratio())) < score_cutoff
+        ):
+            return 0
+        return int(round(100 * m.ratio()))
+
+    def partial_ratio(a: str, b: str, *, score_cutoff: int = 0) -> int:
+        short, long = (a, b) if len(a) <= len(b) else (b, a)
+        m = SequenceMatcher(None, short, long)
+
+        blocks = m.get_matching_blocks()
+
+        scores: list[float] = []
+        for i, j, _ in blocks:
+            start = max(j - i, 0)
+            end = start + len(short)
+            o = SequenceMatcher(None, short, long[start:end])
+            r = o.ratio()
 
+            if 100 * r > 99:
+                return 100
+            scores.append(r)
 
-def partial_ratio(a: str, b: str) -> int:
-    short, long = (a, b) if len(a) <= len(b) else (b, a)
-    m = SequenceMatcher(None, short, long)
+        return int(round(100 * max(scores)))
 
-    blocks = m.get_matching_blocks()
+else:
+    HAS_RAPIDFUZZ = True
 
-    scores: list[float] = []
-    for i, j, _ in blocks:
-        start = max(j - i, 0)
-        end = start + len(short)
-        o = SequenceMatcher(None, short, long[start:end])
-        r = o.ratio()
+    # half a point lower keeps anything that would still round up to the cutoff
+    def ratio(a: str, b: str, *, score_cutoff: int = 0) -> int:
+        return int(round(_rf.ratio(a, b, score_cutoff=max(score_cutoff - 0.5, 0))))
 
-        if 100 * r > 99:
-            return 100
-        scores.append(r)
+    def partial_ratio(a: str, b: str, *, score_cutoff: int = 0) -> int:
+        return int(round(_rf.partial_ratio(a, b, score_cutoff=max(score_cutoff - 0.5, 0))))
 
-    return int(round(100 * max(scores)))
 
+class _TokenTable(dict[int, str]):
+    """``str.translate`` table turning ``\\W`` characters into spaces and lowercasing the rest in one pass.
 
-_word_regex = re.compile(r"\W", re.IGNORECASE)
+    Entries are filled in the first time a code point is seen.
+    """
 
+    __slots__ = ()
 
+    def __missing__(self, key: int) -> str:
+        char = chr(key)
+        if not (char.isalnum() or char == "_"):
+            value = " "
+        elif char == "\N{GREEK CAPITAL LETTER SIGMA}":
+            # lowercases differently at the end of a word, left for str.lower() to handle in context
+            value = char
+        else:
+            value = char.lower()
+
+        self[key] = value
+        return value
+
+
+_TOKEN_TABLE = _TokenTable()
+
+
+@functools.lru_cache(maxsize=4096)
 def _sort_tokens(a: str) -> str:
-    a = _word_regex.sub(" ", a).lower().strip()
+    # isalnum() agrees with \w minus the underscore, so this is already a single clean token
+    if a.isalnum():
+        return a.lower()
+
+    a = a.translate(_TOKEN_TABLE)
+    if "\N{GREEK CAPITAL LETTER SIGMA}" in a:
+        a = a.lower()
     return " ".join(sorted(a.split()))
 
 
-def token_sort_ratio(a: str, b: str) -> int:
+def token_sort_ratio(a: str, b: str, *, score_cutoff: int = 0) -> int:
     a = _sort_tokens(a)
     b = _sort_tokens(b)
-    return ratio(a, b)
+    return ratio(a, b, score_cutoff=score_cutoff)
 
 
-def quick_token_sort_ratio(a: str, b: str) -> int:
+def quick_token_sort_ratio(a: str, b: str, *, score_cutoff: int = 0) -> int:
     a = _sort_tokens(a)
     b = _sort_tokens(b)
-    return quick_ratio(a, b)
+    return quick_ratio(a, b, score_cutoff=score_cutoff)
 
 
-def partial_token_sort_ratio(a: str, b: str) -> int:
+def partial_token_sort_ratio(a: str, b: str, *, score_cutoff: int = 0) -> int:
     a = _sort_tokens(a)
     b = _sort_tokens(b)
-    return partial_ratio(a, b)
+    return partial_ratio(a, b, score_cutoff=score_cutoff)
+
+
+# our own scorers, which all accept score_cutoff; arbitrary scorers passed in may not
+_CUTOFF_SCORERS: frozenset[Callable[..., int]] = frozenset(
+    (ratio, quick_ratio, partial_ratio, token_sort_ratio, quick_token_sort_ratio, partial_token_sort_ratio)
+)
+
+# token sort scorer -> the scorer it applies to the sorted tokens
+_TOKEN_SORT_BASES: dict[Callable[[str, str], int], Callable[[str, str], int]] = {
+    token_sort_ratio: ratio,
+    quick_token_sort_ratio: quick_ratio,
+    partial_token_sort_ratio: partial_ratio,
+}
+
+# our scorer -> (rapidfuzz scorer, preprocessor), lets extract score every choice in a single native call
+_RF_SCORERS: dict[Callable[[str, str], int], tuple[Callable[..., float], Callable[[str], str] | None]] = (
+    {
+        ratio: (_rf.ratio, None),  # pyright: ignore[reportPossiblyUnbound] # guarded by HAS_RAPIDFUZZ
+        partial_ratio: (_rf.partial_ratio, None),  # pyright: ignore[reportPossiblyUnbound]
+        token_sort_ratio: (_rf.ratio, _sort_tokens),  # pyright: ignore[reportPossiblyUnbound]
+        partial_token_sort_ratio: (_rf.partial_ratio, _sort_tokens),  # pyright: ignore[reportPossiblyUnbound]
+    }
+    if HAS_RAPIDFUZZ
+    else {}
+)
+
+
+def _rapidfuzz_extract(
+    query: str,
+    choices: Iterable[str] | dict[str, T],
+    scorer: Callable[[str, str], int],
+    score_cutoff: int,
+) -> list[tuple[str, int]] | list[tuple[str, int, T]]:
+    rf_scorer, processor = _RF_SCORERS[scorer]
+    keys = list(choices)
+    # anything that rounds up to the cutoff has to survive rapidfuzz's own filtering
+    found = _rf_process.extract(  # pyright: ignore[reportPossiblyUnbound]
+        query,
+        keys,
+        scorer=rf_scorer,
+        processor=processor,
+        score_cutoff=max(score_cutoff - 0.5, 0),
+        limit=None,
+    )
+
+    scored: list[tuple[int, int]] = []
+    for _, score, index in found:
+        score = int(round(score))
+        if score >= score_cutoff:
+            scored.append((index, score))
+
+    # highest first, ties keep their input order just like sorting the generator would
+    scored.sort(key=lambda t: (-t[1], t[0]))
+    if isinstance(choices, dict):
+        values = list(choices.values())
+        return [(keys[index], score, values[index]) for index, score in scored]
+    return [(keys[index], score) for index, score in scored]
 
 
 @overload
@@ -101,6 +211,14 @@ def _extraction_generator(
     scorer: Callable[[str, str], int] = quick_ratio,
     score_cutoff: int = 0,
 ) -> Generator[tuple[str, int, T] | tuple[str, int], None, None]:
+    base = _TOKEN_SORT_BASES.get(scorer)
+    if base is not None:
+        # tokenise the query once rather than once per choice
+        query = _sort_tokens(query)
+        scorer = lambda q, c: base(q, _sort_tokens(c), score_cutoff=score_cutoff)
+    elif score_cutoff and scorer in _CUTOFF_SCORERS:
+        scorer = functools.partial(scorer, score_cutoff=score_cutoff)
+
     if isinstance(choices, dict):
         for key, value in choices.items():
             score = scorer(query, key)
@@ -143,11 +261,17 @@ def extract(
     score_cutoff: int = 0,
     limit: int | None = 10,
 ) -> list[tuple[str, int]] | list[tuple[str, int, T]]:
-    it = _extraction_generator(query, choices, scorer, score_cutoff)
-    key = lambda t: t[1]
-    if limit is not None:
-        return heapq.nlargest(limit, it, key=key)
-    return sorted(it, key=key, reverse=True)
+    if scorer in _RF_SCORERS:
+        matches = _rapidfuzz_extract(query, choices, scorer, score_cutoff)
+        return matches if limit is None else matches[:limit]
+
+    items = list(_extraction_generator(query, choices, scorer, score_cutoff))
+    key = operator.itemgetter(1)
+    # the heap only pays off when keeping a small slice of many matches, timsort wins otherwise
+    if limit is None or limit >= len(items) // 2:
+        items.sort(key=key, reverse=True)
+        return items[:limit]
+    return heapq.nlargest(limit, items, key=key)
 
 
 @overload
@@ -177,6 +301,10 @@ def extract_one(
     scorer: Callable[[str, str], int] = quick_ratio,
     score_cutoff: int = 0,
 ) -> tuple[str, int] | tuple[str, int, T] | None:
+    if scorer in _RF_SCORERS:
+        matches = _rapidfuzz_extract(query, choices, scorer, score_cutoff)
+        return matches[0] if matches else None
+
     it = _extraction_generator(query, choices, scorer, score_cutoff)
     key = lambda t: t[1]
     try:
@@ -282,6 +410,13 @@ def extract_matches(
     return to_return
 
 
+@functools.lru_cache(maxsize=256)
+def _finder_regex(text: str) -> re.Pattern[str]:
+    # autocomplete calls finder with the same text on every keystroke
+    pat = ".*?".join(map(re.escape, text))
+    return re.compile(pat, flags=re.IGNORECASE)
+
+
 @overload
 def finder(
     text: str,
@@ -319,25 +454,44 @@ def finder(
     key: Callable[[T], str] | None = None,
     raw: bool = False,
 ) -> list[tuple[int, int, T]] | list[T]:
-    suggestions: list[tuple[int, int, T]] = []
     text = str(text)
-    pat = ".*?".join(map(re.escape, text))
-    regex = re.compile(pat, flags=re.IGNORECASE)
+    regex_search = _finder_regex(text).search
+    # ascii text is matched with a linear str.find scan instead, as the lazy pattern backtracks
+    # polynomially on long non-matching input; lower() keeps ascii offsets intact
+    needle = text.lower() if text and text.isascii() else None
+    first, rest = (needle[0], needle[1:]) if needle else ("", "")
+
+    get = key or str
+    # (length, start, searched string, item)
+    found: list[tuple[int, int, str, T]] = []
     for item in collection:
-        to_search = key(item) if key else str(item)
-        r = regex.search(to_search)
-        if r:
-            suggestions.append((len(r.group()), r.start(), item))
+        to_search = get(item)
+        # '.' in the pattern never crosses a newline, leave those to the regex
+        if needle is not None and to_search.isascii() and "\n" not in to_search:
+            haystack = to_search.lower()
+            start = pos = haystack.find(first)
+            if pos == -1:
+                continue
+
+            for char in rest:
+                pos = haystack.find(char, pos + 1)
+                if pos == -1:
+                    break
+            else:
+                found.append((pos + 1 - start, start, to_search, item))
+        else:
+            r = regex_search(to_search)
+            if r:
+                found.append((r.end() - r.start(), r.start(), to_search, item))
 
-    def sort_key(tup: tuple[int, int, T]) -> tuple[int, int, str | T]:
-        if key:
-            return tup[0], tup[1], key(tup[2])
-        return tup
+    # ties are broken by the key when there is one, otherwise by the item itself
+    found.sort(key=operator.itemgetter(0, 1, 2) if key else operator.itemgetter(0, 1, 3))
+    suggestions = [(length, start, item) for length, start, _, item in found]
 
     if raw:
-        return sorted(suggestions, key=sort_key)
+        return suggestions
     else:
-        return [z for _, _, z in sorted(suggestions, key=sort_key)]
+        return [z for _, _, z in suggestions]
 
 
 def find(text: str, collection: Iterable[str], *, key: Callable[[str], str] | None = None) -> str | None:
@@ -37,24 +37,30 @@ class SharedEvent:
 
     def __init__(self) -> None:
         self._active_count = 0
-        self._event = asyncio.Event()
-        self._event.set()
+        # only created once something waits, most instances never are
+        self._event: asyncio.Event | None = None
 
     def __enter__(self) -> None:
         """Increment the count of the active holders and clear the internal event."""
         self._active_count += 1
-        self._event.clear()
+        if self._event is not None:
+            self._event.clear()
 
     def __exit__(
         self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
     ) -> None:
         """Decrement the count of the active holders; if 0 is reached set the internal event."""
         self._active_count -= 1
-        if not self._active_count:
+        if not self._active_count and self._event is not None:
             self._event.set()
 
     async def wait(self) -> None:
         """Wait for all active holders to exit."""
+        if self._event is None:
+            self._event = asyncio.Event()
+            if not self._active_count:
+                self._event.set()
+
         await self._event.wait()
 
 
@@ -87,6 +93,7 @@ def lock(
         func: Callable[Concatenate[P], Coroutine[Any, Any, T | None]],
     ) -> Callable[Concatenate[P], Coroutine[Any, Any, T | None]]:
         name = func.__name__
+        locks = __lock_dicts[namespace]
 
         @command_wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T | None:
@@ -108,8 +115,9 @@ def lock(
             LOGGER.debug("%s: getting the lock object for resource %r:%r", name, namespace, id_)
 
             # Get the lock for the ID. Create a lock if one doesn't exist yet.
-            locks = __lock_dicts[namespace]
-            lock_ = locks.setdefault(id_, asyncio.Lock())
+            lock_ = locks.get(id_)
+            if lock_ is None:
+                lock_ = locks[id_] = asyncio.Lock()
 
             # It's safe to check an asyncio.Lock is free before acquiring it because:
             #   1. Synchronous code like `if not lock_.locked()` does not yield execution
@@ -1,16 +1,9 @@
 from __future__ import annotations
 
-from copy import copy
-from functools import wraps
-from typing import TYPE_CHECKING, Concatenate, ParamSpec, TypeVar
+from typing import TypeVar
 
 from yarl import URL
 
-if TYPE_CHECKING:
-    from collections.abc import Callable
-
-M = TypeVar("M", bound="MarkdownBuilder")
-P = ParamSpec("P")
 StrOrUrl = TypeVar("StrOrUrl", str, URL)
 
 __all__ = ("MarkdownBuilder",)
@@ -20,57 +13,47 @@ def clamp(value: int, /, max_: int, min_: int) -> int:
     return min(max(min_, value), max_)
 
 
-def after_markdown(func: Callable[Concatenate[M, P], None]) -> Callable[Concatenate[M, P], None]:
-    @wraps(func)
-    def wrapper(item: M, *args: P.args, **kwargs: P.kwargs) -> None:
-        func(item, *args, **kwargs)
-        item._inner += "\n"
-
-    return wrapper
-
-
 class MarkdownBuilder:
     def __init__(self) -> None:
-        self._inner: str = ""
+        self._chunks: list[str] = []
 
     def __str__(self) -> str:
         return self.text
 
     @property
     def text(self) -> str:
-        return self._inner
+        return "".join(self._chunks)
 
     @text.getter
     def text(self) -> str:
-        c = copy(self._inner)
+        c = "".join(self._chunks)
         self.clear()
         return c
 
-    @after_markdown
     def add_header(self, *, text: str, depth: int = 1) -> None:
         depth = clamp(depth, 5, 1)
-        self._inner += "#" * depth
-        self._inner += " " + text
+        self._chunks.append("#" * depth)
+        self._chunks.append(" ")
+        self._chunks.append(text)
+        self._chunks.append("\n")
 
-    @after_markdown
     def add_link(self, *, url: StrOrUrl, text: str) -> None:
-        self._inner += f"[{text}]({url})"
+        self._chunks.append(f"[{text}]({url})")
+        self._chunks.append("\n")
 
-    @after_markdown
     def add_bulletpoints(self, *, texts: list[str]) -> None:
-        builder = ""
-        for item in texts:
-            builder += f" - {item}\n"
+        if texts:
+            self._chunks.append(" - " + "\n - ".join(texts) + "\n")
 
-        self._inner += builder
+        self._chunks.append("\n")
 
-    @after_markdown
     def add_text(self, *, text: str) -> None:
-        self._inner += text
+        self._chunks.append(text)
+        self._chunks.append("\n")
 
-    @after_markdown
     def add_newline(self, *, amount: int = 1) -> None:
-        self._inner += "\n" * amount
+        self._chunks.append("\n" * amount)
+        self._chunks.append("\n")
 
     def clear(self) -> None:
-        self._inner = ""
+        self._chunks.clear()
@@ -8,15 +8,17 @@ This file was sourced from [RoboDanny](https://github.com/Rapptz/RoboDanny).
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
-from contextlib import suppress
-from functools import partial
+from contextlib import contextmanager, suppress
 from textwrap import shorten
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
 
 import discord
 from discord.ext import menus
 from discord.ext.commands import Paginator as CommandPaginator
+from discord.utils import MISSING
 
 from .scheduling import create_task
 from .ui import BaseView
@@ -30,8 +32,11 @@ except ModuleNotFoundError:
 else:
     HAS_HONDANA = True
 
+# how long page changes are coalesced for before the message is edited
+_PAGE_DEBOUNCE = 0.15
+
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Collection, Iterator, Sequence
     from typing import Self
 
     from utilities.context import Context, Interaction
@@ -47,7 +52,7 @@ def reaction_check(
     user: discord.abc.User,
     *,
     message_id: int,
-    allowed_emoji: Sequence[str],
+    allowed_emoji: Collection[str],
     allowed_users: Sequence[int],
     allowed_roles: Sequence[int] | None = None,
 ) -> bool:
@@ -61,8 +66,10 @@ def reaction_check(
     if not right_reaction:
         return False
 
-    allowed_roles = allowed_roles or []
-    has_sufficient_roles = any(role.id in allowed_roles for role in getattr(user, "roles", []))
+    # frozenset() hands back a frozenset argument as is, so callers can convert once up front
+    has_sufficient_roles = allowed_roles is not None and not frozenset(allowed_roles).isdisjoint(
+        [role.id for role in getattr(user, "roles", ())]
+    )
 
     if user.id in allowed_users or has_sufficient_roles:
         LOGGER.debug("Allowed reaction %s by %s on %s.", reaction, user, reaction.message.id)
@@ -77,6 +84,21 @@ def reaction_check(
     return False
 
 
+def _resolve_page_kwargs(value: Any) -> Callable[[Any], dict[str, Any]]:
+    if isinstance(value, dict):
+        return lambda value: value
+    elif isinstance(value, str):
+        return lambda value: {"content": value, "embed": None}
+    elif isinstance(value, discord.Embed):
+        return lambda value: {"embed": value, "content": None}
+    else:
+        return lambda _: {}
+
+
+# format_page result type -> how RoboPages turns it into message kwargs
+_PAGE_KWARGS: dict[type, Callable[[Any], dict[str, Any]]] = {}
+
+
 class NumberedPageModal(discord.ui.Modal, title="Go to page"):
     page = discord.ui.TextInput["Self"](label="Page", placeholder="Enter a number", min_length=1)
 
@@ -108,6 +130,15 @@ class RoboPages(BaseView):
         self.message: discord.Message | None = None
         self.current_page: int = 0
         self.compact: bool = compact
+        self._debounce_task: asyncio.Task[None] | None = None
+        self._last_interaction: Interaction | None = None
+        # (page number, page) fetched by show_page, handed on to the debounced edit
+        self._fetched_page: tuple[int, Any] | None = None
+        # formatted pages of a ListPageSource, whose entries can't change under us
+        self._page_cache: dict[int, dict[str, Any]] = {}
+        # a ListPageSource can't change length mid session, so its page count is fixed by start()
+        self._max_pages: int | None = None
+        self._format_page_is_coro: bool = inspect.iscoroutinefunction(source.format_page)
         self.clear_items()
         self.fill_items()
 
@@ -132,32 +163,90 @@ class RoboPages(BaseView):
             self.add_item(self.stop_pages)
 
     async def _get_kwargs_from_page(self, page: int) -> dict[str, Any]:
-        value = await discord.utils.maybe_coroutine(self.source.format_page, self, page)
-        if isinstance(value, dict):
-            return value
-        elif isinstance(value, str):
-            return {"content": value, "embed": None}
-        elif isinstance(value, discord.Embed):
-            return {"embed": value, "content": None}
+        if self._format_page_is_coro:
+            value = await self.source.format_page(self, page)
         else:
-            return {}
+            value = self.source.format_page(self, page)
+        # a source hands back the same type page after page, so the isinstance chain only runs once per type
+        try:
+            to_kwargs = _PAGE_KWARGS[type(value)]
+        except KeyError:
+            to_kwargs = _PAGE_KWARGS[type(value)] = _resolve_page_kwargs(value)
+        return to_kwargs(value)
+
+    def _get_max_pages(self) -> int | None:
+        if self._max_pages is not None:
+            return self._max_pages
+        return self.source.get_max_pages()
+
+    async def _get_page_kwargs(self, page_number: int, page: Any = MISSING) -> dict[str, Any]:
+        try:
+            return self._page_cache[page_number]
+        except KeyError:
+            pass
+
+        if page is MISSING:
+            page = await self.source.get_page(page_number)
+        kwargs = await self._get_kwargs_from_page(page)
+        # dicts may carry single use attachments, so only plain text and embeds are kept
+        if isinstance(self.source, menus.ListPageSource) and kwargs.keys() == {"content", "embed"}:
+            embed = kwargs["embed"]
+            if embed is not None:
+                # sources are free to keep mutating the embed they hand out, so hold a snapshot
+                embed = embed.copy()
+            self._page_cache[page_number] = {"content": kwargs["content"], "embed": embed}
+        return kwargs
 
     async def show_page(self, interaction: Interaction, page_number: int) -> None:
-        page = await self.source.get_page(page_number)
+        # fetched up front so an invalid page raises before anything is changed, the edit then reuses it
+        if page_number in self._page_cache:
+            self._fetched_page = None
+        else:
+            self._fetched_page = (page_number, await self.source.get_page(page_number))
         self.current_page = page_number
-        kwargs = await self._get_kwargs_from_page(page)
-        self._update_labels(page_number)
-        if kwargs:
-            if interaction.response.is_done():
-                if self.message:
-                    await self.message.edit(**kwargs, view=self)
+        # every page change acknowledges the same way, so the edit below never has to care
+        if not interaction.response.is_done():
+            await interaction.response.defer()
+        self._last_interaction = interaction
+
+        # rapid clicks only move current_page, the pending edit picks up wherever it ends up
+        if self._debounce_task is None:
+            self._debounce_task = create_task(self._edit_debounced(), name=f"robopages-debounce-{id(self)}")
+
+    async def _edit_debounced(self) -> None:
+        await asyncio.sleep(_PAGE_DEBOUNCE)
+        # clicks landing during the edit below schedule their own
+        self._debounce_task = None
+        interaction, self._last_interaction = self._last_interaction, None
+
+        page_number = self.current_page
+        fetched, self._fetched_page = self._fetched_page, None
+        try:
+            if fetched is not None and fetched[0] == page_number:
+                kwargs = await self._get_page_kwargs(page_number, fetched[1])
             else:
-                await interaction.response.edit_message(**kwargs, view=self)
+                kwargs = await self._get_page_kwargs(page_number)
+            self._update_labels(page_number)
+            if kwargs and interaction and not self.is_finished():
+                await interaction.edit_original_response(**kwargs, view=self)
+        except Exception as exc:
+            if interaction is None:
+                raise
+            # this runs outside the item callback now, so hand failures to on_error as the callback would have
+            await self.on_error(interaction, exc, self._item_for(interaction))
+
+    def _item_for(self, interaction: Interaction) -> discord.ui.Item[Self]:
+        custom_id = (interaction.data or {}).get("custom_id")
+        for item in self.children:
+            if isinstance(item, discord.ui.Button) and item.custom_id == custom_id:
+                return item
+        # the only page change not started by one of our buttons is the numbered page modal
+        return self.numbered_page
 
     def _update_labels(self, page_number: int) -> None:
+        max_pages = self._get_max_pages()
         self.go_to_first_page.disabled = page_number == 0
         if self.compact:
-            max_pages = self.source.get_max_pages()
             self.go_to_last_page.disabled = max_pages is None or (page_number + 1) >= max_pages
             self.go_to_next_page.disabled = max_pages is not None and (page_number + 1) >= max_pages
             self.go_to_previous_page.disabled = page_number == 0
@@ -170,7 +259,6 @@ class RoboPages(BaseView):
         self.go_to_previous_page.disabled = False
         self.go_to_first_page.disabled = False
 
-        max_pages = self.source.get_max_pages()
         if max_pages is not None:
             self.go_to_last_page.disabled = (page_number + 1) >= max_pages
             if (page_number + 1) >= max_pages:
@@ -181,7 +269,7 @@ class RoboPages(BaseView):
                 self.go_to_previous_page.label = "…"
 
     async def show_checked_page(self, interaction: Interaction, page_number: int) -> None:
-        max_pages = self.source.get_max_pages()
+        max_pages = self._get_max_pages()
         try:
             if max_pages is None:
                 # If it doesn't give maximum pages, it cannot be checked
@@ -213,9 +301,14 @@ class RoboPages(BaseView):
             await self.ctx.send("Bot does not have embed links permission in this channel.", ephemeral=True)
             return
 
-        await self.source._prepare_once()
-        page = await self.source.get_page(0)
-        kwargs = await self._get_kwargs_from_page(page)
+        # the default prepare does nothing, only sources that override it need the await
+        if type(self.source).prepare is not menus.PageSource.prepare:
+            await self.source._prepare_once()
+        self._page_cache.clear()
+        if isinstance(self.source, menus.ListPageSource):
+            self._max_pages = self.source.get_max_pages()
+
+        kwargs = await self._get_page_kwargs(0)
         if content:
             kwargs.setdefault("content", content)
 
@@ -245,7 +338,7 @@ class RoboPages(BaseView):
     async def go_to_last_page(self, interaction: Interaction, button: discord.ui.Button) -> None:
         """go to the last page"""
         # The call here is safe because it's guarded by skip_if
-        await self.show_page(interaction, self.source.get_max_pages() - 1)  # type: ignore
+        await self.show_page(interaction, self._get_max_pages() - 1)  # type: ignore
 
     @discord.ui.button(label="Skip to page...", style=discord.ButtonStyle.grey)
     async def numbered_page(self, interaction: Interaction, button: discord.ui.Button) -> None:
@@ -253,7 +346,7 @@ class RoboPages(BaseView):
         if self.message is None:
             return
 
-        modal = NumberedPageModal(self.source.get_max_pages())
+        modal = NumberedPageModal(self._get_max_pages())
         await interaction.response.send_modal(modal)
         timed_out = await modal.wait()
 
@@ -264,13 +357,15 @@ class RoboPages(BaseView):
             await modal.interaction.response.send_message("Took too long", ephemeral=True)
             return
 
-        value = str(modal.page.value)
+        value = modal.page.value
         if not value.isdigit():
             await modal.interaction.response.send_message(f"Expected a number not {value!r}", ephemeral=True)
             return
 
-        value = int(value)
-        await self.show_checked_page(modal.interaction, value - 1)
+        # more digits than the page count has is out of range anyway, so don't bother converting it
+        max_length = modal.page.max_length
+        if max_length is None or len(value) <= max_length:
+            await self.show_checked_page(modal.interaction, int(value) - 1)
         if not modal.interaction.response.is_done():
             error = modal.page.placeholder.replace("Enter", "Expected")  # type: ignore # Can't be None
             await modal.interaction.response.send_message(error, ephemeral=True)
@@ -300,19 +395,21 @@ class FieldPageSource(menus.ListPageSource, Generic[RoboPagesT]):
         self.inline: bool = inline
 
     async def format_page(self, menu: RoboPagesT, entries: list[tuple[Any, Any]]) -> discord.Embed:
-        self.embed.clear_fields()
+        # self.embed is the template, every page gets its own copy
+        embed = self.embed.copy()
+        embed.clear_fields()
         if self.clear_description:
-            self.embed.description = None
+            embed.description = None
 
         for key, value in entries:
-            self.embed.add_field(name=key, value=value, inline=self.inline)
+            embed.add_field(name=key, value=value, inline=self.inline)
 
         maximum = self.get_max_pages()
         if maximum > 1:
             text = f"Page {menu.current_page + 1}/{maximum} ({len(self.entries)} entries)"
-            self.embed.set_footer(text=text)
+            embed.set_footer(text=text)
 
-        return self.embed
+        return embed
 
 
 class TextPageSource(menus.ListPageSource, Generic[RoboPagesT]):
@@ -331,18 +428,26 @@ class TextPageSource(menus.ListPageSource, Generic[RoboPagesT]):
 
 
 class SimplePageSource(menus.ListPageSource, Generic[SimplePagesT]):
-    async def format_page(self, menu: SimplePagesT, entries: Sequence[Any]) -> discord.Embed:
-        pages = []
-        for index, entry in enumerate(entries, start=menu.current_page * self.per_page):
-            pages.append(f"{index + 1}. {entry}")
+    def __init__(self, entries: Sequence[Any], *, per_page: int) -> None:
+        super().__init__(entries, per_page=per_page)
+        numbered = [f"{index}. {entry}" for index, entry in enumerate(self.entries, start=1)]
+        self._page_bodies: list[str] = [
+            "\n".join(numbered[start : start + per_page]) for start in range(0, len(numbered), per_page)
+        ] or [""]
+
+    async def get_page(self, page_number: int) -> str:
+        # pages are numbered up front, so a page is its prebuilt body
+        return self._page_bodies[page_number]
 
+    async def format_page(self, menu: SimplePagesT, entries: str) -> discord.Embed:
+        embed = menu.embed.copy()
         maximum = self.get_max_pages()
         if maximum > 1:
             footer = f"Page {menu.current_page + 1}/{maximum} ({len(self.entries)} entries)"
-            menu.embed.set_footer(text=footer)
+            embed.set_footer(text=footer)
 
-        menu.embed.description = "\n".join(pages)
-        return menu.embed
+        embed.description = entries
+        return embed
 
 
 class SimplePages(RoboPages):
@@ -358,9 +463,13 @@ class SimplePages(RoboPages):
 
 class SimpleListSource(menus.ListPageSource, Generic[T]):
     def __init__(self, data: list[T], per_page: int = 1) -> None:
-        self.data = data
         super().__init__(data, per_page=per_page)
 
+    @property
+    def data(self) -> list[T]:
+        # kept for existing callers, ListPageSource already holds the list as entries
+        return self.entries
+
     @overload
     async def format_page(self, menu: menus.Menu, entries: list[T]) -> list[T]: ...
 
@@ -385,8 +494,8 @@ if HAS_HONDANA:
             if chapter.chapter:
                 parent_title += f" [Chapter {chapter.chapter}]"
 
-            if parent.cover_url() is None:
-                await parent.get_cover()
+            # fetched alongside building the rest of the embed, it's only needed for the thumbnail
+            cover_task = asyncio.create_task(parent.get_cover()) if parent.cover_url() is None else None
 
             self = cls(title=parent_title, colour=discord.Colour.red(), url=chapter.url)
             self.set_footer(text=chapter.id)
@@ -402,6 +511,9 @@ if HAS_HONDANA:
             if chapter.uploader:
                 self.add_field(name="Uploader:", value=chapter.uploader.username, inline=False)
 
+            if cover_task is not None:
+                await cover_task
+
             if parent.content_rating is hondana.ContentRating.safe or (nsfw_allowed is True):  # pyright: ignore[reportUnboundVariable] # hondana may not be installed, we're covered
                 self.set_thumbnail(url=parent.cover_url())
 
@@ -442,13 +554,125 @@ class PaginationEmojis(discord.Enum):
     left = "\u2b05"
     right = "\u27a1"
     last = "\u23ed"
-    delete = "\u1f6aE"
+    delete = "\U0001f6ae"
+
+
+# iterating an Enum goes through its metaclass each time, so every paginator shares this one
+_PAGINATION_EMOJI: tuple[PaginationEmojis, ...] = tuple(PaginationEmojis)
 
 
 class EmptyPaginatorEmbedError(Exception):
     """Raised when attempting to paginate with empty contents."""
 
 
+@contextmanager
+def _suppress_archived_thread() -> Iterator[None]:
+    """Suppresses the error Discord raises when acting on an archived thread, any other HTTP error propagates."""
+    try:
+        yield
+    except discord.HTTPException as e:
+        if e.code != 50083:
+            raise
+
+
+class PaginatorView(BaseView):
+    """The buttons driving a :class:`LinePaginator` session.
+
+    Pages are switched by editing the message in the interaction response, the embed's description
+    and footer are rewritten in place for each page.
+    """
+
+    def __init__(
+        self,
+        pages: list[str],
+        *,
+        embed: discord.Embed,
+        footer_text: str | None,
+        allowed_users: Collection[int],
+        allowed_roles: Collection[int] | None,
+        timeout: float,
+    ) -> None:
+        super().__init__(timeout=timeout)
+        self.pages: list[str] = pages
+        self.embed: discord.Embed = embed
+        self.footer_text: str | None = footer_text
+        self.allowed_users: frozenset[int] = frozenset(allowed_users)
+        self.allowed_roles: frozenset[int] = frozenset(allowed_roles or ())
+        self.current_page: int = 0
+        self.message: discord.Message | None = None
+        # the pages never change once paginated, so the total is baked into the footer up front
+        self._last_page: int = len(pages) - 1
+        # split around the page number rather than a format string, footer_text may contain braces
+        self._footer_head: str = f"{footer_text} (Page " if footer_text else "Page "
+        self._footer_tail: str = f"/{len(pages)})" if footer_text else f"/{len(pages)}"
+        self._update_page()
+
+    def _update_page(self) -> None:
+        page_number = self.current_page
+        self.embed.description = self.pages[page_number]
+        self.embed.set_footer(text=f"{self._footer_head}{page_number + 1}{self._footer_tail}")
+
+        self.go_to_first_page.disabled = self.go_to_previous_page.disabled = page_number == 0
+        self.go_to_next_page.disabled = self.go_to_last_page.disabled = page_number >= self._last_page
+
+    async def show_page(self, interaction: Interaction, page_number: int) -> None:
+        self.current_page = page_number
+        self._update_page()
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Changing to page %s/%s", page_number + 1, self._last_page + 1)
+        with _suppress_archived_thread():
+            await interaction.response.edit_message(embed=self.embed, view=self)
+            return
+
+        # Trying to act on an archived thread, just ignore and abort
+        self.stop()
+
+    async def interaction_check(self, interaction: Interaction) -> bool:
+        user = interaction.user
+        if user.id in self.allowed_users or not self.allowed_roles.isdisjoint(
+            [role.id for role in getattr(user, "roles", ())]
+        ):
+            return True
+        await interaction.response.send_message("This pagination menu cannot be controlled by you, sorry!", ephemeral=True)
+        return False
+
+    async def on_timeout(self) -> None:
+        if self.message is None:
+            return
+
+        LOGGER.debug("Ending pagination and removing the buttons.")
+        with suppress(discord.NotFound), _suppress_archived_thread():
+            await self.message.edit(view=None)
+
+    @discord.ui.button(emoji=PaginationEmojis.first.value, style=discord.ButtonStyle.grey)
+    async def go_to_first_page(self, interaction: Interaction, button: discord.ui.Button) -> None:
+        """go to the first page"""
+        await self.show_page(interaction, 0)
+
+    @discord.ui.button(emoji=PaginationEmojis.left.value, style=discord.ButtonStyle.blurple)
+    async def go_to_previous_page(self, interaction: Interaction, button: discord.ui.Button) -> None:
+        """go to the previous page"""
+        await self.show_page(interaction, max(self.current_page - 1, 0))
+
+    @discord.ui.button(emoji=PaginationEmojis.delete.value, style=discord.ButtonStyle.red)
+    async def stop_pages(self, interaction: Interaction, button: discord.ui.Button) -> None:
+        """delete the paginated message."""
+        LOGGER.debug("Got delete button")
+        await interaction.response.defer()
+        await interaction.delete_original_response()
+        self.stop()
+
+    @discord.ui.button(emoji=PaginationEmojis.right.value, style=discord.ButtonStyle.blurple)
+    async def go_to_next_page(self, interaction: Interaction, button: discord.ui.Button) -> None:
+        """go to the next page"""
+        await self.show_page(interaction, min(self.current_page + 1, self._last_page))
+
+    @discord.ui.button(emoji=PaginationEmojis.last.value, style=discord.ButtonStyle.grey)
+    async def go_to_last_page(self, interaction: Interaction, button: discord.ui.Button) -> None:
+        """go to the last page"""
+        await self.show_page(interaction, self._last_page)
+
+
 class _LinePaginator(CommandPaginator):
     """
     A class that aids in paginating code blocks for Discord messages.
@@ -495,7 +719,7 @@ class _LinePaginator(CommandPaginator):
         self._linecount = 0
         self._count = len(prefix) + 1  # prefix + newline
         self._pages = []
-        self.pagination_emoji = list(PaginationEmojis)
+        self.pagination_emoji: tuple[PaginationEmojis, ...] = _PAGINATION_EMOJI
 
     def add_line(self, line: str = "", *, empty: bool = False) -> None:
         """
@@ -522,34 +746,38 @@ class _LinePaginator(CommandPaginator):
         """
         assert self.prefix
 
-        remaining_words = None
-        if len(line) > (max_chars := self.max_size - len(self.prefix) - 2) and len(line) > self.scale_to_size:
-            line, remaining_words = self._split_remaining_words(line, max_chars)
-            if len(line) > self.scale_to_size:
-                LOGGER.debug("Could not continue to next page, truncating line.")
-                line = line[: self.scale_to_size]
-
-        # Check if we should start a new page or continue the line on the current one
-        if self.max_lines is not None and self._linecount >= self.max_lines:
-            LOGGER.debug("max_lines exceeded, creating new page.")
-            self._new_page()
-        elif self._count + len(line) + 1 > self.max_size and self._linecount > 0:
-            LOGGER.debug("max_size exceeded on page with lines, creating new page.")
-            self._new_page()
-
-        self._linecount += 1
-
-        self._count += len(line) + 1
-        self._current_page.append(line)
-
-        if empty:
-            self._current_page.append("")
-            self._count += 1
-
-        # Start a new page if there were any overflow words
-        if remaining_words:
+        max_chars = self.max_size - len(self.prefix) - 2
+        while True:
+            remaining_words = None
+            if len(line) > max_chars and len(line) > self.scale_to_size:
+                line, remaining_words = self._split_remaining_words(line, max_chars)
+                if len(line) > self.scale_to_size:
+                    LOGGER.debug("Could not continue to next page, truncating line.")
+                    line = line[: self.scale_to_size]
+
+            # Check if we should start a new page or continue the line on the current one
+            if self.max_lines is not None and self._linecount >= self.max_lines:
+                LOGGER.debug("max_lines exceeded, creating new page.")
+                self._new_page()
+            elif self._count + len(line) + 1 > self.max_size and self._linecount > 0:
+                LOGGER.debug("max_size exceeded on page with lines, creating new page.")
+                self._new_page()
+
+            self._linecount += 1
+
+            self._count += len(line) + 1
+            self._current_page.append(line)
+
+            if empty:
+                self._current_page.append("")
+                self._count += 1
+
+            if not remaining_words:
+                break
+
+            # Start a new page for the overflow words, which carry on as a line of their own
             self._new_page()
-            self.add_line(remaining_words)
+            line, empty = remaining_words, False
 
     def _new_page(self) -> None:
         """
@@ -580,32 +808,19 @@ class _LinePaginator(CommandPaginator):
 
         Return a tuple in the format (reduced_words, remaining_words).
         """
-        reduced_words = []
-        remaining_words = []
-
         # "(Continued)" is used on a line by itself to indicate the continuation of last page
         continuation_header = "(Continued)\n-----------\n"
-        reduced_char_count = 0
-        is_full = False
-
-        for word in line.split(" "):
-            if not is_full:
-                if len(word) + reduced_char_count <= max_chars:
-                    reduced_words.append(word)
-                    reduced_char_count += len(word) + 1
-                else:
-                    # If reduced_words is empty, we were unable to split the words across pages
-                    if not reduced_words:
-                        return line, None
-                    is_full = True
-                    remaining_words.append(word)
-            else:
-                remaining_words.append(word)
 
-        return (
-            " ".join(reduced_words) + "..." if remaining_words else "",
-            continuation_header + " ".join(remaining_words) if remaining_words else None,
-        )
+        if len(line) <= max_chars:
+            return "", None
+
+        # the last word boundary that keeps the reduced words within max_chars
+        cut = line.rfind(" ", 0, max_chars + 1)
+        # If there is none, we were unable to split the words across pages
+        if cut == -1:
+            return line, None
+
+        return line[:cut] + "...", continuation_header + line[cut + 1 :]
 
     @classmethod
     async def paginate(
@@ -628,14 +843,13 @@ class _LinePaginator(CommandPaginator):
         allowed_roles: Sequence[int] | None = None,
     ) -> discord.Message | None:
         """
-        Use a paginator and set of reactions to provide pagination over a set of lines.
+        Use a paginator and set of buttons to provide pagination over a set of lines.
 
-        The reactions are used to switch page, or to finish with pagination.
+        The buttons are used to switch page, or to delete the paginated message.
 
-        When used, this will send a message using `ctx.send()` and apply a set of reactions to it. These reactions may
-        be used to change page, or to remove pagination from the message.
+        When used, this will send a message using `ctx.send()` with a :class:`PaginatorView` attached to it.
 
-        Pagination will also be removed automatically if no reaction is added for five minutes (300 seconds).
+        Pagination will also be removed automatically if no button is pressed for five minutes (300 seconds).
 
         The interaction will be limited to `restrict_to_user` (ctx.author by default) or
         to any user with a moderation role.
@@ -665,7 +879,6 @@ class _LinePaginator(CommandPaginator):
         >>> await LinePaginator.paginate(pagination_emojis, [line for line in lines], ctx, embed)
         """
         paginator = cls(prefix=prefix, suffix=suffix, max_size=max_size, max_lines=max_lines, scale_to_size=scale_to_size)
-        current_page = 0
 
         if not restrict_to_user:
             restrict_to_user = ctx.user if isinstance(ctx, discord.Interaction) else ctx.author
@@ -678,138 +891,60 @@ class _LinePaginator(CommandPaginator):
             LOGGER.debug("No lines to add to paginator, adding '(nothing to display)' message")
             lines.append("*(nothing to display)*")
 
-        for line in lines:
-            try:
+        # one handler around the whole loop, `line` still names the offender if it fails
+        line = None
+        try:
+            for line in lines:
                 paginator.add_line(line, empty=empty)
-            except Exception:
-                LOGGER.exception("Failed to add line to paginator: '%s'", line)
-                raise  # Should propagate
-            else:
-                LOGGER.debug("Added line to paginator: '%s'", line)
+        except Exception:
+            LOGGER.exception("Failed to add line to paginator: '%s'", line)
+            raise  # Should propagate
 
-        LOGGER.debug("Paginator created with %s pages", len(paginator.pages))
-
-        embed.description = paginator.pages[current_page]
+        # the property re-renders the page in progress and copies the list on each access, so read it once
+        pages = paginator.pages
+        LOGGER.debug("Paginator created with %s pages", len(pages))
 
         reference = ctx.message if reply else None
+        if url:
+            embed.url = url
+            LOGGER.debug("Setting embed url to '%s'", url)
 
-        if len(paginator.pages) <= 1:
+        if len(pages) <= 1:
+            embed.description = pages[0]
             if footer_text:
                 embed.set_footer(text=footer_text)
                 LOGGER.debug("Setting embed footer to '%s'", footer_text)
 
-            if url:
-                embed.url = url
-                LOGGER.debug("Setting embed url to '%s'", url)
-
             LOGGER.debug("There's less than two pages, so we won't paginate - sending single page on its own")
 
             if isinstance(ctx, discord.Interaction):
                 return await ctx.response.send_message(embed=embed)
             return await ctx.send(embed=embed, reference=reference)
 
-        if footer_text:
-            embed.set_footer(text=f"{footer_text} (Page {current_page + 1}/{len(paginator.pages)})")
-        else:
-            embed.set_footer(text=f"Page {current_page + 1}/{len(paginator.pages)}")
-        LOGGER.debug("Setting embed footer to '%s'", embed.footer.text)
-
-        if url:
-            embed.url = url
-            LOGGER.debug("Setting embed url to '%s'", url)
+        view = PaginatorView(
+            pages,
+            embed=embed,
+            footer_text=footer_text,
+            allowed_users=(restrict_to_user.id,),
+            allowed_roles=allowed_roles,
+            timeout=timeout,
+        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            # embed.footer builds a new proxy object on every access
+            LOGGER.debug("Setting embed footer to '%s'", embed.footer.text)
 
         LOGGER.debug("Sending first page to channel...")
 
         if isinstance(ctx, discord.Interaction):
-            await ctx.response.send_message(embed=embed)
-            message = await ctx.original_response()
+            response = await ctx.response.send_message(embed=embed, view=view)
+            # the callback response already carries the sent message, fetching it again is only a fallback
+            message = response.resource
+            view.message = message if isinstance(message, discord.InteractionMessage) else await ctx.original_response()
         else:
-            message = await ctx.send(embed=embed, reference=reference, wait=True)
-
-        LOGGER.debug("Adding emoji reactions to message...")
+            view.message = await ctx.send(embed=embed, reference=reference, view=view, wait=True)
 
-        pagination_emoji = [e.value for e in list(PaginationEmojis)]
-
-        for emoji in pagination_emoji:
-            # Add all the applicable emoji to the message
-            LOGGER.debug("Adding reaction: %r", emoji)
-            await message.add_reaction(emoji)
-
-        check = partial(
-            reaction_check,
-            message_id=message.id,
-            allowed_emoji=pagination_emoji,
-            allowed_users=(restrict_to_user.id,),
-            allowed_roles=allowed_roles,
-        )
-
-        while True:
-            try:
-                if isinstance(ctx, discord.Interaction):
-                    reaction, user = await ctx.client.wait_for("reaction_add", timeout=timeout, check=check)
-                else:
-                    reaction, user = await ctx.bot.wait_for("reaction_add", timeout=timeout, check=check)
-                LOGGER.debug("Got reaction: %s", reaction)
-            except TimeoutError:
-                LOGGER.debug("Timed out waiting for a reaction")
-                break  # We're done, no reactions for the last 5 minutes
-
-            if str(reaction.emoji) == PaginationEmojis.delete:
-                LOGGER.debug("Got delete reaction")
-                return await message.delete()
-            if reaction.emoji in pagination_emoji:
-                total_pages = len(paginator.pages)
-                try:
-                    await message.remove_reaction(reaction.emoji, user)
-                except discord.HTTPException as e:
-                    # Suppress if trying to act on an archived thread.
-                    if e.code != 50083:
-                        raise e
-
-                if reaction.emoji == PaginationEmojis.first:
-                    current_page = 0
-                    LOGGER.debug("Got first page reaction - changing to page 1/%s", total_pages)
-                elif reaction.emoji == PaginationEmojis.last:
-                    current_page = len(paginator.pages) - 1
-                    LOGGER.debug("Got last page reaction - changing to page %s/%s", current_page + 1, total_pages)
-                elif reaction.emoji == PaginationEmojis.left:
-                    if current_page <= 0:
-                        LOGGER.debug("Got previous page reaction, but we're on the first page - ignoring")
-                        continue
-
-                    current_page -= 1
-                    LOGGER.debug("Got previous page reaction - changing to page %s/%s", current_page + 1, total_pages)
-                elif reaction.emoji == PaginationEmojis.right:
-                    if current_page >= len(paginator.pages) - 1:
-                        LOGGER.debug("Got next page reaction, but we're on the last page - ignoring")
-                        continue
-
-                    current_page += 1
-                    LOGGER.debug("Got next page reaction - changing to page %s/%s", current_page + 1, total_pages)
-
-                embed.description = paginator.pages[current_page]
-
-                if footer_text:
-                    embed.set_footer(text=f"{footer_text} (Page {current_page + 1}/{len(paginator.pages)})")
-                else:
-                    embed.set_footer(text=f"Page {current_page + 1}/{len(paginator.pages)}")
-
-                try:
-                    await message.edit(embed=embed)
-                except discord.HTTPException as e:
-                    if e.code == 50083:
-                        # Trying to act on an archived thread, just ignore and abort
-                        break
-                    raise e
-
-        LOGGER.debug("Ending pagination and clearing reactions.")
-        with suppress(discord.NotFound):
-            try:
-                await message.clear_reactions()
-            except discord.HTTPException as e:
-                # Suppress if trying to act on an archived thread.
-                if e.code != 50083:
-                    raise e
+        # the session ends once the message is deleted or nobody pressed a button for `timeout` seconds
+        await view.wait()
 
 
 class LinePaginator(_LinePaginator):
@@ -841,7 +976,7 @@ class LinePaginator(_LinePaginator):
         **kwargs,  # noqa: ANN003
     ) -> discord.Message | None:
         """
-        Use a paginator and set of reactions to provide pagination over a set of lines.
+        Use a paginator and set of buttons to provide pagination over a set of lines.
 
         Acts as a wrapper for the super class' `paginate` method to provide the pagination emojis by default.
 
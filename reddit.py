@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
+import time
 from typing import TYPE_CHECKING, Any, Self, TypedDict, TypeVar
 
 import aiohttp
 from discord.utils import MISSING
 
+from .formats import from_json
+from .scheduling import create_task
+
 AUTH_ROUTE_BASE = "https://www.reddit.com/api/v1"
 ROUTE_BASE = "https://oauth.reddit.com/"
+# how long before the token expires it's refreshed in the background
+REFRESH_MARGIN = 60
 
 if TYPE_CHECKING:
     from ._types.xiv.reddit.auth import PasswordAuth
@@ -31,26 +38,34 @@ class RedditConfig(TypedDict):
 class _RedditSecretHandler:
     __slots__ = (
         "token",
+        "bearer",
         "expires",
+        "_deadline",
         "_scopes",
     )
 
     def __init__(self, token: str, expires: int, scopes: str) -> None:
         self.token = token
+        self.bearer = f"Bearer {token}"
         self.expires = datetime.datetime.now(datetime.UTC) + datetime.timedelta(seconds=expires)
-        self._scopes = scopes
+        # what expiry checks compare against, far cheaper to read than an aware datetime.now()
+        self._deadline = time.monotonic() + expires
+        # split once here, the property used to split on every access
+        self._scopes: list[str] = scopes.split(" ")
 
     def __repr__(self) -> str:
         return "<SecretHandler>"
 
     @property
     def scopes(self) -> list[str]:
-        return self._scopes.split(" ")
+        return self._scopes
 
     def _update_from_payload(self, data: PasswordAuth) -> Self:
         self.token = data["access_token"]
+        self.bearer = f"Bearer {self.token}"
         self.expires = datetime.datetime.now(datetime.UTC) + datetime.timedelta(seconds=data["expires_in"])
-        self._scopes = data["scope"]
+        self._deadline = time.monotonic() + data["expires_in"]
+        self._scopes = data["scope"].split(" ")
 
         return self
 
@@ -61,6 +76,11 @@ class RedditHandler:
         "session",
         "config",
         "headers",
+        "_owns_session",
+        "_request_headers",
+        "_refresh_handle",
+        "_refresh_lock",
+        "_basic_auth",
     )
 
     def __init__(self, *, session: aiohttp.ClientSession, config: RedditConfig) -> None:
@@ -68,6 +88,30 @@ class RedditHandler:
         self.config = config
         self.headers = {"User-Agent": self.config["user_agent"]}
         self.__handler: _RedditSecretHandler = MISSING
+        self._owns_session: bool = False
+        # headers for API requests, the Authorization entry is swapped in place whenever the token is refreshed
+        self._request_headers: dict[str, str] = self.headers.copy()
+        self._refresh_handle: asyncio.TimerHandle | None = None
+        self._refresh_lock: asyncio.Lock = asyncio.Lock()
+        self._basic_auth: aiohttp.BasicAuth = aiohttp.BasicAuth(config["client_id"], config["client_secret"])
+
+    @classmethod
+    def create(cls, config: RedditConfig) -> Self:
+        """Creates a handler with a session of its own, tuned for the couple of Reddit hosts it talks to.
+
+        Must be called with a running event loop. The session is closed with :meth:`close`.
+        """
+        connector = aiohttp.TCPConnector(ttl_dns_cache=300, limit_per_host=10, keepalive_timeout=75)
+        session = aiohttp.ClientSession(connector=connector, headers={"User-Agent": config["user_agent"]})
+        self = cls(session=session, config=config)
+        self._owns_session = True
+        return self
+
+    async def close(self) -> None:
+        """Closes the session, if it was created by :meth:`create`."""
+        self._cancel_refresh()
+        if self._owns_session:
+            await self.session.close()
 
     @property
     def token(self) -> str:
@@ -84,19 +128,26 @@ class RedditHandler:
     def has_expired(self) -> bool:
         if self.__handler is MISSING:
             return True
-        return datetime.datetime.now(datetime.UTC) > self.__handler.expires
+        return time.monotonic() > self.__handler._deadline
 
     def to_bearer(self) -> str:
-        return f"Bearer {self.__handler.token}"
+        return self.__handler.bearer
 
     async def get_token(self) -> Self:
         if not self.has_expired():
             return self
 
-        return await self.refresh()
+        # concurrent callers on an expired token wait for the first one's refresh rather than each doing their own
+        async with self._refresh_lock:
+            if not self.has_expired():
+                return self
+            return await self.refresh()
+
+    async def _background_refresh(self) -> None:
+        async with self._refresh_lock:
+            await self.refresh()
 
     async def refresh(self) -> Self:
-        basic_auth = aiohttp.BasicAuth(self.config["client_id"], self.config["client_secret"])
         body = {
             "username": self.config["username"],
             "password": self.config["password"],
@@ -105,28 +156,43 @@ class RedditHandler:
         }
 
         async with (
-            self.session.post(f"{AUTH_ROUTE_BASE}/access_token", data=body, auth=basic_auth, headers=self.headers) as resp,
+            self.session.post(f"{AUTH_ROUTE_BASE}/access_token", data=body, auth=self._basic_auth, headers=self.headers) as resp,
         ):
-            response: PasswordAuth = await resp.json()
+            response: PasswordAuth = from_json(await resp.read())
 
         self.__handler = _RedditSecretHandler(
             response["access_token"], expires=response["expires_in"], scopes=response["scope"]
         )
+        self._request_headers["Authorization"] = self.to_bearer()
+        self._schedule_refresh(response["expires_in"])
         return self
 
+    def _schedule_refresh(self, expires_in: int) -> None:
+        # renew ahead of expiry so requests don't have to wait on the auth round trip
+        self._cancel_refresh()
+        if expires_in > REFRESH_MARGIN:
+            self._refresh_handle = asyncio.get_running_loop().call_later(
+                expires_in - REFRESH_MARGIN,
+                lambda: create_task(self._background_refresh(), name="reddit-token-refresh"),
+            )
+
+    def _cancel_refresh(self) -> None:
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+
     async def revoke(self) -> None:
+        self._cancel_refresh()
         body_data = {"token": self.__handler.token, "token_type_hint": "access_token"}
-        headers = {"User-Agent": self.config["user_agent"]}
-        auth = aiohttp.BasicAuth(self.config["client_id"], self.config["client_secret"])
-        await self.session.post(f"{AUTH_ROUTE_BASE}/revoke_token", headers=headers, data=body_data, auth=auth)
+        await self.session.post(
+            f"{AUTH_ROUTE_BASE}/revoke_token", headers=self.headers, data=body_data, auth=self._basic_auth
+        )
 
     async def get(self, url: str, *, limit: int = 10) -> Any:
-        token_handler = await self.get_token()
-        headers = self.headers.copy()
-        headers.update({"Authorization": token_handler.to_bearer()})
-        async with self.session.get(url, headers=headers, params={"limit": limit}) as resp:
+        await self.get_token()
+        async with self.session.get(url, headers=self._request_headers, params={"limit": limit}) as resp:
             if not resp.ok:
                 LOGGER.error("The API request to Reddit has failed with the status code: '%s'", resp.status)
                 raise ValueError("Reddit API request failed.")
 
-            return await resp.json()
+            return from_json(await resp.read())
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import pathlib
+
+# async_config has no package-relative imports, so it is loaded straight from its file
+# putting the package directory on sys.path would shadow the stdlib with its queue and time modules
+_spec = importlib.util.spec_from_file_location(
+    "async_config", pathlib.Path(__file__).resolve().parents[1] / "async_config.py"
+)
+assert _spec is not None and _spec.loader is not None
+async_config = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(async_config)
+Config = async_config.Config
+
+
+def test_load_later_without_running_loop(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "config.bin"
+
+    async def populate() -> None:
+        config: Config[int] = Config(path)
+        await config.put("answer", 42)
+
+    asyncio.run(populate())
+
+    config: Config[int] = Config(path, load_later=True)
+    assert config.get("answer") == 42
+    assert "answer" in config
+    assert len(config) == 1
+
+
+def test_load_later_with_running_loop(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "config.bin"
+
+    async def populate() -> None:
+        config: Config[int] = Config(path)
+        await config.put("answer", 42)
+
+    async def reload() -> None:
+        config: Config[int] = Config(path, load_later=True)
+        await config.put("other", 1)
+        assert config.get("answer") == 42
+        assert config.get("other") == 1
+
+    asyncio.run(populate())
+    asyncio.run(reload())
@@ -8,9 +8,12 @@ This file was sourced from [RoboDanny](https://github.com/Rapptz/RoboDanny).
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import enum
+import functools
 import re
+import threading
 from typing import TYPE_CHECKING
 
 import parsedatetime as pdt
@@ -22,6 +25,9 @@ from .formats import human_join, plural
 if TYPE_CHECKING:
     from ..context import Context
 
+_utcnow = datetime.datetime.now
+_UTC = datetime.UTC
+
 # Monkey patch mins and secs into the units
 units = pdt.pdtLocales["en_US"].units
 units["minutes"].append("mins")
@@ -41,39 +47,86 @@ class Weekday(enum.Enum):
 
 
 class ShortTime:
+    # e.g. 2y, 2months, 10w, 14d, 12h, 10m, 15s
     compiled = re.compile(
-        r"""(?:(?P<years>[0-9])(?:years?|y))?             # e.g. 2y
-                             (?:(?P<months>[0-9]{1,2})(?:months?|mo))?     # e.g. 2months
-                             (?:(?P<weeks>[0-9]{1,4})(?:weeks?|w))?        # e.g. 10w
-                             (?:(?P<days>[0-9]{1,5})(?:days?|d))?          # e.g. 14d
-                             (?:(?P<hours>[0-9]{1,5})(?:hours?|h))?        # e.g. 12h
-                             (?:(?P<minutes>[0-9]{1,5})(?:minutes?|m))?    # e.g. 10m
-                             (?:(?P<seconds>[0-9]{1,5})(?:seconds?|s))?    # e.g. 15s
-                          """,
-        re.VERBOSE,
+        r"(?:(?P<years>[0-9])(?:years?|y))?"
+        r"(?:(?P<months>[0-9]{1,2})(?:months?|mo))?"
+        r"(?:(?P<weeks>[0-9]{1,4})(?:weeks?|w))?"
+        r"(?:(?P<days>[0-9]{1,5})(?:days?|d))?"
+        r"(?:(?P<hours>[0-9]{1,5})(?:hours?|h))?"
+        r"(?:(?P<minutes>[0-9]{1,5})(?:minutes?|m))?"
+        r"(?:(?P<seconds>[0-9]{1,5})(?:seconds?|s))?"
     )
 
     def __init__(self, argument: str, *, now: datetime.datetime | None = None) -> None:
-        match = self.compiled.fullmatch(argument)
-        if match is None or not match.group(0):
+        values = _parse_short_time(argument)
+        if values is None:
             raise commands.BadArgument("invalid time provided")
 
-        data = {k: int(v) for k, v in match.groupdict(default=0).items()}
-        now = now or datetime.datetime.utcnow().replace(tzinfo=datetime.UTC)
-        self.dt = now + relativedelta(**data)  # type: ignore # pyright dict expansion sadness
+        now = now or _utcnow(_UTC)
+        self.dt = now + _short_time_delta(values)
 
     @classmethod
     async def convert(cls, ctx: Context, argument: str) -> ShortTime:
         return cls(argument, now=ctx.message.created_at)
 
 
+_SHORT_FULLMATCH = ShortTime.compiled.fullmatch
+_SHORT_MATCH = ShortTime.compiled.match
+
+
+# the same handful of durations ("5m", "1h", "1d") come up over and over, so the parsed values are kept around
+@functools.lru_cache(maxsize=1024)
+def _parse_short_time(argument: str) -> tuple[int, ...] | None:
+    # every unit starts with a number, anything else can't match
+    if not argument[:1].isdigit():
+        return None
+
+    match = _SHORT_FULLMATCH(argument)
+    if match is None or not match.group(0):
+        return None
+    return _short_time_values(match)
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_short_time(argument: str) -> tuple[tuple[int, ...], int] | None:
+    # like _parse_short_time, but for a duration leading the argument, also giving where it ends
+    if not argument[:1].isdigit():
+        return None
+
+    match = _SHORT_MATCH(argument)
+    if match is None or not match.group(0):
+        return None
+    return _short_time_values(match), match.end()
+
+
+def _short_time_values(match: re.Match[str]) -> tuple[int, ...]:
+    years, months, weeks, days, hours, minutes, seconds = match.groups(default="0")
+    return int(years), int(months), int(weeks), int(days), int(hours), int(minutes), int(seconds)
+
+
+def _short_time_delta(values: tuple[int, ...]) -> relativedelta:
+    years, months, weeks, days, hours, minutes, seconds = values
+    return relativedelta(
+        years=years, months=months, weeks=weeks, days=days, hours=hours, minutes=minutes, seconds=seconds
+    )
+
+
+# parsedatetime keeps per-parse state on the Calendar and parsing runs in worker threads, so only one at a time
+_CALENDAR_LOCK = threading.Lock()
+
+# stripped from the start of a reminder before handing it to parsedatetime
+_REMINDER_PREFIXES = ("me to ", "me in ", "me at ")
+
+
 class HumanTime:
     dt: datetime.datetime
     calendar = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
 
     def __init__(self, argument: str, *, now: datetime.datetime | None = None) -> None:
-        now = now or datetime.datetime.utcnow().replace(tzinfo=datetime.UTC)
-        dt, status = self.calendar.parseDT(argument, sourceTime=now)
+        now = now or _utcnow(_UTC)
+        with _CALENDAR_LOCK:
+            dt, status = self.calendar.parseDT(argument, sourceTime=now)
         assert isinstance(status, pdt.pdtContext)
         if not status.hasDateOrTime:
             raise commands.BadArgument(
@@ -82,20 +135,15 @@ class HumanTime:
 
         if not status.hasTime:
             # replace it with the current time
-            dt = dt.replace(
-                hour=now.hour,
-                minute=now.minute,
-                second=now.second,
-                microsecond=now.microsecond,
-                tzinfo=datetime.UTC,
-            )
+            dt = datetime.datetime.combine(dt.date(), now.time(), _UTC)
 
         self.dt = dt
         self._past = dt < now
 
     @classmethod
     async def convert(cls, ctx: Context, argument: str) -> HumanTime:
-        return cls(argument, now=ctx.message.created_at)
+        # parsedatetime is slow enough on longer input to hold up the event loop
+        return await asyncio.to_thread(cls, argument, now=ctx.message.created_at)
 
 
 class Time(HumanTime):
@@ -170,15 +218,13 @@ class UserFriendlyTime(commands.Converter):
         result = self.copy()
         remaining = ""
         try:
-            calendar = HumanTime.calendar
-            regex = ShortTime.compiled
             now = ctx.message.created_at
 
-            match = regex.match(argument)
-            if match is not None and match.group(0):
-                data = {k: int(v) for k, v in match.groupdict(default=0).items()}
-                remaining = argument[match.end() :].strip()
-                result.dt = now + relativedelta(**data)  # type: ignore # pyright dict expansion sadness
+            short = _match_short_time(argument)
+            if short is not None:
+                values, end = short
+                remaining = argument[end:].strip()
+                result.dt = now + _short_time_delta(values)
                 return await result.check_constraints(ctx, now, remaining)
 
             # apparently nlp does not like "from now"
@@ -186,15 +232,11 @@ class UserFriendlyTime(commands.Converter):
             if argument.endswith("from now"):
                 argument = argument[:-8].strip()
 
-            if argument[0:2] == "me" and argument[0:6] in (
-                "me to ",
-                "me in ",
-                "me at ",
-            ):
+            if argument.startswith(_REMINDER_PREFIXES):
                 # starts with "me to", "me in", or "me at "
                 argument = argument[6:]
 
-            elements = calendar.nlp(argument, sourceTime=now)
+            elements = await asyncio.to_thread(_calendar_nlp, argument, now)
             if elements is None or len(elements) == 0:
                 raise commands.BadArgument(
                     'Invalid time provided, try e.g. "tomorrow" or "3 days".',
@@ -221,13 +263,8 @@ class UserFriendlyTime(commands.Converter):
                 )
 
             if not status.hasTime:
-                # replace it with the current time
-                dt = dt.replace(
-                    hour=now.hour,
-                    minute=now.minute,
-                    second=now.second,
-                    microsecond=now.microsecond,
-                )
+                # replace it with the current time, the timezone is set below
+                dt = datetime.datetime.combine(dt.date(), now.time())
 
             # if midnight is provided, just default to next day
             if status.accuracy == pdt.pdtContext.ACU_HALFDAY:
@@ -262,6 +299,14 @@ class UserFriendlyTime(commands.Converter):
             raise
 
 
+def _calendar_nlp(
+    argument: str,
+    now: datetime.datetime,
+) -> tuple[tuple[datetime.datetime, pdt.pdtContext, int, int, str], ...] | None:
+    with _CALENDAR_LOCK:
+        return HumanTime.calendar.nlp(argument, sourceTime=now)
+
+
 def human_timedelta(
     dt: datetime.datetime,
     *,
@@ -270,7 +315,7 @@ def human_timedelta(
     brief: bool = False,
     suffix: bool = True,
 ) -> str:
-    now = source or (datetime.datetime.now(datetime.UTC))
+    now = source or _utcnow(_UTC)
     # Microsecond free zone
     now = now.replace(microsecond=0)
     dt = dt.replace(microsecond=0)
@@ -287,37 +332,21 @@ def human_timedelta(
         delta = relativedelta(now, dt)
         str_suffix = " ago" if suffix else ""
 
-    attrs: list[tuple[str, str]] = [
-        ("year", "y"),
-        ("month", "mo"),
-        ("day", "d"),
-        ("hour", "h"),
-        ("minute", "m"),
-        ("second", "s"),
-    ]
-
-    output = []
-    for attr, brief_attr in attrs:
-        elem = getattr(delta, attr + "s")
-        if not elem:
-            continue
-
-        if attr == "day":
-            weeks = delta.weeks
-            if weeks:
-                elem -= weeks * 7
-                if not brief:
-                    output.append(format(plural(weeks), "week"))
-                else:
-                    output.append(f"{weeks}w")
-
-        if elem <= 0:
-            continue
+    weeks = delta.weeks
+    units = (
+        (delta.years, "year", "y"),
+        (delta.months, "month", "mo"),
+        (weeks, "week", "w"),
+        (delta.days - weeks * 7, "day", "d"),
+        (delta.hours, "hour", "h"),
+        (delta.minutes, "minute", "m"),
+        (delta.seconds, "second", "s"),
+    )
 
-        if brief:
-            output.append(f"{elem}{brief_attr}")
-        else:
-            output.append(format(plural(elem), attr))
+    if brief:
+        output = [f"{elem}{brief_attr}" for elem, _, brief_attr in units if elem > 0]
+    else:
+        output = [format(plural(elem), attr) for elem, attr, _ in units if elem > 0]
 
     if accuracy is not None:
         output = output[:accuracy]
@@ -329,12 +358,22 @@ def human_timedelta(
     return " ".join(output) + str_suffix
 
 
-def ordinal(number: int) -> str:
+def _ordinal(number: int) -> str:
     return f"{number}{'tsnrhtdd'[(number//10%10!=1)*(number%10<4)*number%10::4]}"
 
 
+# covers every day of the month
+_DAY_ORDINALS: tuple[str, ...] = tuple(map(_ordinal, range(32)))
+
+
+def ordinal(number: int) -> str:
+    if 0 <= number < 32:
+        return _DAY_ORDINALS[number]
+    return _ordinal(number)
+
+
 def hf_time(dt: datetime.datetime, *, with_time: bool = True) -> str:
-    date_modif = ordinal(dt.day)
+    date_modif = _DAY_ORDINALS[dt.day]
     if with_time:
         return dt.strftime(f"%A {date_modif} of %B %Y @ %H:%M %Z (%z)")
     return dt.strftime(f"%A {date_modif} of %B %Y")
@@ -347,7 +386,7 @@ def resolve_next_weekday(
     current_week_included: bool = False,
     before_time: datetime.time | None = None,
 ) -> datetime.datetime:
-    source = source or datetime.datetime.now(datetime.UTC)
+    source = source or _utcnow(_UTC)
     weekday = source.weekday()
 
     if weekday == target.value:
@@ -359,16 +398,13 @@ def resolve_next_weekday(
             return source
         return source + datetime.timedelta(days=7)
 
-    while source.weekday() != target.value:
-        source += datetime.timedelta(days=1)
-
-    return source
+    return source + datetime.timedelta(days=(target.value - weekday) % 7)
 
 
 def resolve_previous_weekday(
     *, target: Weekday, source: datetime.datetime | None = None, current_week_included: bool = False
 ) -> datetime.datetime:
-    source = source or datetime.datetime.now(datetime.UTC)
+    source = source or _utcnow(_UTC)
     weekday = source.weekday()
 
     if weekday == target.value:
@@ -376,7 +412,4 @@ def resolve_previous_weekday(
             return source
         return source + datetime.timedelta(days=7)
 
-    while source.weekday() != target.value:
-        source -= datetime.timedelta(days=1)
-
-    return source
+    return source - datetime.timedelta(days=(weekday - target.value) % 7)
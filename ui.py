@@ -23,6 +23,10 @@ if TYPE_CHECKING:
 
 __all__ = ("BaseModal", "BaseView", "ConfirmationView")
 
+_utcnow = datetime.datetime.now
+_UTC = datetime.UTC
+_Button = discord.ui.Button
+
 
 class BaseModal(discord.ui.Modal):
     async def on_error(
@@ -37,7 +41,7 @@ class BaseModal(discord.ui.Modal):
         trace = "\n".join(traceback.format_exception(exc_type, exc, tb))
 
         e.add_field(name="Error", value=f"```py\n{trace}\n```")
-        e.timestamp = datetime.datetime.now(datetime.UTC)
+        e.timestamp = _utcnow(_UTC)
 
         stats: Stats = interaction.client.get_cog("Stats")  # type: ignore
         try:
@@ -86,13 +90,13 @@ class BaseView(discord.ui.View):
         else:
             embed.description = f"```py\n{clean}\n```"
 
-        embed.timestamp = datetime.datetime.now(datetime.UTC)
+        embed.timestamp = _utcnow(_UTC)
         await interaction.client.logging_webhook.send(embed=embed)
         await interaction.client.owner.send(embed=embed)
 
     def _disable_all_buttons(self) -> None:
         for item in self.children:
-            if isinstance(item, discord.ui.Button):
+            if isinstance(item, _Button):
                 item.disabled = True
 
     async def on_timeout(self) -> None: